@@ -1,21 +1,36 @@
 import sys
+import atexit
+import queue
 import argparse
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-from src.ui.gradio_app import create_app
-
 
 def setup_logging(level: str = "INFO"):
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    handlers = [
+        logging.StreamHandler(sys.stdout),
+        logging.FileHandler("interview_app.log"),
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Request threads only enqueue records; a background listener does the I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Records are formatted by the real handlers, so pass the message through
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=getattr(logging, level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler("interview_app.log"),
-        ],
+        handlers=[queue_handler],
     )
 
 
@@ -52,9 +67,20 @@ def main():
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
 
+    # Imported here so --help does not pay for Gradio, LangChain and ReportLab
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     try:
+        from langchain_core.caches import InMemoryCache
+        from langchain_core.globals import set_llm_cache
+
+        from src.ui.gradio_app import create_app
+
+        # Identical prompts (e.g. the opening question) skip the Gemini round trip
+        set_llm_cache(InMemoryCache(maxsize=1024))
+
         app = create_app()
 
         print("""
@@ -1,9 +1,28 @@
-from .models import Question, ResponseRecord, InterviewState
-from .evaluator import LLMEvaluator
-from .reporter import Reporter
-from .engine import InterviewEngine
-from .persistence import Persistence
-from .question_generator import QuestionGenerator
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Question, ResponseRecord, InterviewState
+    from .evaluator import LLMEvaluator
+    from .reporter import Reporter
+    from .engine import InterviewEngine
+    from .persistence import Persistence
+    from .question_generator import QuestionGenerator
+    from .semantic_cache import SemanticCache
+
+# Submodules are imported on first attribute access, so importing the models
+# or persistence alone doesn't pull in LangChain, numpy and ReportLab
+_EXPORTS = {
+    "Question": ".models",
+    "ResponseRecord": ".models",
+    "InterviewState": ".models",
+    "LLMEvaluator": ".evaluator",
+    "Reporter": ".reporter",
+    "InterviewEngine": ".engine",
+    "Persistence": ".persistence",
+    "QuestionGenerator": ".question_generator",
+    "SemanticCache": ".semantic_cache",
+}
 
 __all__ = [
     "Question",
@@ -14,4 +33,18 @@ __all__ = [
     "InterviewEngine",
     "Persistence",
     "QuestionGenerator",
+    "SemanticCache",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
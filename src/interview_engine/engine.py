@@ -1,8 +1,11 @@
+import asyncio
 import uuid
 import logging
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime, timezone
 
+import orjson
+
 from src.interview_engine.models import Question, InterviewState
 from src.interview_engine.reporter import Reporter
 from src.interview_engine.evaluator import LLMEvaluator
@@ -11,6 +14,11 @@ from src.interview_engine.question_generator import QuestionGenerator
 
 logger = logging.getLogger(__name__)
 
+# Phases the question generator may hand the interview over to from "qa"
+_QA_TRANSITIONS = frozenset({"reflection", "closing"})
+
+_END_EARLY_MESSAGE = "No problem at all! Thanks for the time we had together. I'll generate a feedback report based on our conversation so far - you've shared some great insights!"
+
 
 class InterviewEngine:
     def __init__(
@@ -36,78 +44,169 @@ class InterviewEngine:
         )
 
         self._current_message = ""
+        # The report is fixed once generated, so it is only rendered to text once
+        self._text_report: Optional[str] = None
+
+        # Phase -> handler tables, looked up once per turn instead of an if/elif chain
+        self._ask_next_handlers = {
+            "intro": self._ask_intro,
+            "qa": self._ask_qa,
+            "reflection": self._ask_reflection,
+            "closing": self._ask_closing,
+        }
+        self._response_handlers = {
+            "scenario": self._process_scenario_response,
+            "reflection": self._process_reflection_response,
+        }
 
     def ask_next(self) -> str:
-        if self.state.phase == "intro":
-            self._current_message = self._get_intro_message()
-            self.state.phase = "qa"
-            self._save_state()
+        handler = self._ask_next_handlers.get(self.state.phase)
+        if handler is None:
+            return "Interview session ended."
+        return handler()
+
+    def _ask_intro(self) -> str:
+        self._current_message = self._get_intro_message()
+        self.state.phase = "qa"
+        self._save_state()
+        return self._current_message
+
+    def _ask_qa(self) -> str:
+        elapsed_minutes = self._get_elapsed_minutes()
+
+        if elapsed_minutes >= 15:
+            self.state.phase = "closing"
+            self._current_message = "I notice we've reached our 15-minute time limit. That wraps up our conversation! I really enjoyed learning about your Excel expertise and approach to problem-solving. I'm putting together your feedback report now - give me just a moment..."
             return self._current_message
 
-        elif self.state.phase == "qa":
-            elapsed_minutes = self._get_elapsed_minutes()
+        try:
+            time_status = self._get_time_status()
+            response = self.question_generator.generate_next_response(
+                self.state, time_status
+            )
+            return self._apply_qa_response(response)
 
-            if elapsed_minutes >= 15:
+        except Exception as e:
+            logger.error(f"Failed to generate next response: {e}")
+            self._current_message = (
+                "Let me continue with another question about your Excel experience."
+            )
+            return self._current_message
+
+    def _ask_reflection(self) -> str:
+        try:
+            time_status = self._get_time_status()
+            response = self.question_generator.generate_reflection_response(
+                self.state, time_status
+            )
+
+            if (
+                response.get("phase_transition")
+                and response.get("new_phase") == "closing"
+            ):
                 self.state.phase = "closing"
-                self._current_message = "I notice we've reached our 15-minute time limit. That wraps up our conversation! I really enjoyed learning about your Excel expertise and approach to problem-solving. I'm putting together your feedback report now - give me just a moment..."
-                return self._current_message
+                self._generate_final_report()
 
-            try:
-                time_status = self._get_time_status()
-                response = self.question_generator.generate_next_response(
-                    self.state, time_status
-                )
+            self._current_message = response.get(
+                "text", "Thank you for that reflection."
+            )
+            return self._current_message
 
-                if response.get("phase_transition"):
-                    new_phase = response.get("new_phase")
-                    if new_phase in ["reflection", "closing"]:
-                        self.state.phase = new_phase
-                        if new_phase == "closing":
-                            self._generate_final_report()
+        except Exception as e:
+            logger.error(f"Failed to generate reflection response: {e}")
+            self.state.phase = "closing"
+            return self.ask_next()
+
+    def _ask_closing(self) -> str:
+        if not self.state.feedback_report:
+            self._generate_final_report()
+        self._current_message = "Perfect! I've finished your personalized feedback report. It includes detailed insights on your responses and some actionable suggestions for your Excel skills development. Thanks for the engaging conversation!"
+        return self._current_message
 
-                self._current_message = response.get(
-                    "text", "Let me think of our next question..."
-                )
-                return self._current_message
+    def _apply_qa_response(self, response: dict) -> str:
+        if response.get("phase_transition"):
+            new_phase = response.get("new_phase")
+            if new_phase in _QA_TRANSITIONS:
+                self.state.phase = new_phase
+                if new_phase == "closing":
+                    self._generate_final_report()
 
-            except Exception as e:
-                logger.error(f"Failed to generate next response: {e}")
-                self._current_message = (
-                    "Let me continue with another question about your Excel experience."
-                )
-                return self._current_message
+        self._current_message = response.get(
+            "text", "Let me think of our next question..."
+        )
+        return self._current_message
 
-        elif self.state.phase == "reflection":
-            try:
-                time_status = self._get_time_status()
-                response = self.question_generator.generate_reflection_response(
-                    self.state, time_status
-                )
+    async def _aapply_qa_response(self, response: dict) -> str:
+        """Async variant of _apply_qa_response"""
+        if response.get("phase_transition"):
+            new_phase = response.get("new_phase")
+            if new_phase in _QA_TRANSITIONS:
+                self.state.phase = new_phase
+                if new_phase == "closing":
+                    await self._agenerate_final_report()
+
+        self._current_message = response.get(
+            "text", "Let me think of our next question..."
+        )
+        return self._current_message
 
-                if (
-                    response.get("phase_transition")
-                    and response.get("new_phase") == "closing"
-                ):
-                    self.state.phase = "closing"
-                    self._generate_final_report()
+    async def aask_next_stream(self) -> AsyncIterator[str]:
+        """Like ask_next, but yields the growing reply text while it is generated"""
+        if self.state.phase != "qa" or self._get_elapsed_minutes() >= 15:
+            yield await asyncio.to_thread(self.ask_next)
+            return
 
-                self._current_message = response.get(
-                    "text", "Thank you for that reflection."
-                )
-                return self._current_message
+        try:
+            time_status = self._get_time_status()
+            response = {}
+            async for item in self.question_generator.astream_next_response(
+                self.state, time_status
+            ):
+                # Partial reply text, then the finished response dict
+                if isinstance(item, dict):
+                    response = item
+                else:
+                    yield item
+            yield await self._aapply_qa_response(response)
 
-            except Exception as e:
-                logger.error(f"Failed to generate reflection response: {e}")
-                self.state.phase = "closing"
-                return self.ask_next()
+        except Exception as e:
+            logger.error(f"Failed to stream next response: {e}")
+            self._current_message = (
+                "Let me continue with another question about your Excel experience."
+            )
+            yield self._current_message
 
-        elif self.state.phase == "closing":
-            if not self.state.feedback_report:
-                self._generate_final_report()
-            self._current_message = "Perfect! I've finished your personalized feedback report. It includes detailed insights on your responses and some actionable suggestions for your Excel skills development. Thanks for the engaging conversation!"
-            return self._current_message
+    async def aprocess_response_stream(self, user_text: str) -> AsyncIterator[str]:
+        """Like process_response, but streams the follow-up question"""
+        if not (
+            user_text.strip()
+            and self.state.phase == "qa"
+            and len(self.state.responses) < len(self.state.questions)
+        ):
+            yield await asyncio.to_thread(self.process_response, user_text)
+            return
+
+        question = self.state.questions[len(self.state.responses)]
 
-        return "Interview session ended."
+        try:
+            response_record = await self.evaluator.aevaluate(
+                question, user_text, self.state
+            )
+            self.state.responses.append(response_record)
+
+            # Write the snapshot while the next question streams in, and see it
+            # through even if generation fails so the answer is never lost
+            save_task = asyncio.ensure_future(
+                asyncio.to_thread(self._save_state, self._state_snapshot())
+            )
+            try:
+                async for partial in self.aask_next_stream():
+                    yield partial
+            finally:
+                await save_task
+
+        except Exception as e:
+            yield self._handle_response_error(e)
 
     def process_response(self, user_text: str) -> str:
         if not user_text.strip():
@@ -119,14 +218,11 @@ class InterviewEngine:
             ):
                 return self._process_qa_response(user_text)
 
-            elif self.state.phase == "scenario":
-                return self._process_scenario_response(user_text)
+            handler = self._response_handlers.get(self.state.phase)
+            if handler is not None:
+                return handler(user_text)
 
-            elif self.state.phase == "reflection":
-                return self._process_reflection_response(user_text)
-
-            else:
-                return self.ask_next()
+            return self.ask_next()
 
         except Exception as e:
             logger.error(f"Error processing response: {e}")
@@ -154,8 +250,12 @@ class InterviewEngine:
             return next_message
 
         except Exception as e:
-            logger.error(f"Error evaluating response: {e}")
-            return "I'm having a small technical issue on my end, but let's keep the conversation going with the next question."
+            return self._handle_response_error(e)
+
+    def _handle_response_error(self, e: Exception) -> str:
+        """Log a failed qa turn and reply with the graceful fallback message"""
+        logger.error(f"Error evaluating response: {e}")
+        return "I'm having a small technical issue on my end, but let's keep the conversation going with the next question."
 
     def _process_scenario_response(self, user_text: str) -> str:
         scenario_question = Question(
@@ -202,29 +302,44 @@ class InterviewEngine:
             return f"I really appreciate your thoughtful reflection on the interview. {next_message}"
 
     def _generate_final_report(self):
+        self._text_report = None
         try:
             self.state.feedback_report = (
                 self.reporter.generate_constructive_feedback_report(self.state)
             )
+            self._save_final_report()
 
-            if self.persistence:
-                self.persistence.save_report(
-                    self.state.session_id, self.state.feedback_report
-                )
+        except Exception as e:
+            logger.error(f"Error generating final report: {e}")
+            self.state.feedback_report = self._failed_report()
 
-            self._save_state()
+    async def _agenerate_final_report(self):
+        """Async variant of _generate_final_report"""
+        self._text_report = None
+        try:
+            self.state.feedback_report = (
+                await self.reporter.agenerate_constructive_feedback_report(self.state)
+            )
+            await asyncio.to_thread(self._save_final_report)
 
         except Exception as e:
             logger.error(f"Error generating final report: {e}")
-            import datetime
-
-            self.state.feedback_report = {
-                "error": "Failed to generate report",
-                "session_id": self.state.session_id,
-                "timestamp": datetime.datetime.now(
-                    tz=datetime.timezone.utc
-                ).isoformat(),
-            }
+            self.state.feedback_report = self._failed_report()
+
+    def _save_final_report(self):
+        if self.persistence:
+            self.persistence.save_report(
+                self.state.session_id, self.state.feedback_report
+            )
+
+        self._save_state()
+
+    def _failed_report(self) -> dict:
+        return {
+            "error": "Failed to generate report",
+            "session_id": self.state.session_id,
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+        }
 
     def _get_intro_message(self) -> str:
         return """Hi there! I'm excited to chat with you about your Excel skills and experience. 
@@ -268,11 +383,11 @@ Walk me through your approach to diagnose and fix this performance issue. What t
         return self.state.feedback_report
 
     def get_text_report(self) -> Optional[str]:
-        if self.state.feedback_report:
-            return self.reporter.format_constructive_text_report(
+        if self._text_report is None and self.state.feedback_report:
+            self._text_report = self.reporter.format_constructive_text_report(
                 self.state.feedback_report
             )
-        return None
+        return self._text_report
 
     def get_pdf_report_path(self) -> Optional[str]:
         """Generate and return the path to a PDF report"""
@@ -282,24 +397,46 @@ Walk me through your approach to diagnose and fix this performance issue. What t
 
     def save(self, path: Optional[str] = None) -> str:
         if path:
-            import json
-
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(self.state.model_dump(), f, indent=2, default=str)
+            with open(path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        self.state.model_dump(),
+                        default=str,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
             return path
         else:
             return self._save_state()
 
-    def _save_state(self) -> str:
+    def _state_snapshot(self) -> InterviewState:
+        """Copy of the state that stays stable while it is saved from another thread"""
+        # Records are never mutated once appended, so only the lists that grow
+        # during a turn need copying, not every question and response
+        return self.state.model_copy(
+            update={
+                "questions": list(self.state.questions),
+                "responses": list(self.state.responses),
+            }
+        )
+
+    def _save_state(self, state: Optional[InterviewState] = None) -> str:
         if self.persistence:
-            return self.persistence.save_state(self.state)
+            return self.persistence.save_state(state or self.state)
         return ""
 
     def end_early(self) -> str:
         self.state.end_time = datetime.now(tz=timezone.utc)
         self.state.phase = "closing"
         self._generate_final_report()
-        return "No problem at all! Thanks for the time we had together. I'll generate a feedback report based on our conversation so far - you've shared some great insights!"
+        return _END_EARLY_MESSAGE
+
+    async def aend_early(self) -> str:
+        """Async variant of end_early that awaits the report's LLM call"""
+        self.state.end_time = datetime.now(tz=timezone.utc)
+        self.state.phase = "closing"
+        await self._agenerate_final_report()
+        return _END_EARLY_MESSAGE
 
     def _get_elapsed_minutes(self) -> float:
         """Calculate elapsed time since interview start in minutes"""
@@ -1,35 +1,25 @@
+import asyncio
+import copy
 import hashlib
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import datetime, timezone
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from cachetools import TTLCache
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
+from src.interview_engine.llm import get_chat_model
 from src.interview_engine.models import Question, ResponseRecord, InterviewState
+from src.interview_engine.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
 
-class LLMEvaluator:
-    def __init__(self, model_name: str = "gemini-2.5-flash", temperature: float = 0.1):
-        self.model_name = model_name
-        self.temperature = temperature
-        self.llm = ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
-
-        self.prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", self._get_system_prompt()),
-                ("human", self._get_evaluation_prompt()),
-            ]
-        )
-
-        self.parser = JsonOutputParser()
-        self.chain = self.prompt_template | self.llm | self.parser
-
-    def _get_system_prompt(self) -> str:
-        return """
+_SYSTEM_PROMPT = """
         <system_prompt>
         <role>
             <primary_function>objective technical interviewer evaluator</primary_function>
@@ -98,25 +88,15 @@ class LLMEvaluator:
         </system_prompt>
         """
 
-    def _get_evaluation_prompt(self) -> str:
-        return """
+# Per-turn inputs come after the static rubric so the provider can reuse its
+# cached prefix across calls
+_EVALUATION_PROMPT = """
         <system_prompt>
         <role>
             <primary_function>objective technical interviewer evaluator</primary_function>
             <evaluation_task>assess candidate answers against provided rubric</evaluation_task>
         </role>
 
-        <input_structure>
-            <question_section>
-            <label>QUESTION:</label>
-            <content>{question_text}</content>
-            </question_section>
-            <answer_section>
-            <label>CANDIDATE ANSWER:</label>
-            <content>{answer_text}</content>
-            </answer_section>
-        </input_structure>
-
         <evaluation_rubric>
             <scoring_dimensions>
             <dimension name="correctness" range="0-5">
@@ -200,6 +180,17 @@ class LLMEvaluator:
             </json_schema>
         </output_format>
 
+        <input_structure>
+            <question_section>
+            <label>QUESTION:</label>
+            <content>{question_text}</content>
+            </question_section>
+            <answer_section>
+            <label>CANDIDATE ANSWER:</label>
+            <content>{answer_text}</content>
+            </answer_section>
+        </input_structure>
+
         <evaluation_instructions>
             <assessment_approach>objective and rubric-based</assessment_approach>
             <scoring_method>align scores with provided rubric criteria</scoring_method>
@@ -209,39 +200,232 @@ class LLMEvaluator:
         </system_prompt>
         """
 
+# Parsed once at import; instances only bind their own LLM into the chain
+_PARSER = JsonOutputParser()
+_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [("system", _SYSTEM_PROMPT), ("human", _EVALUATION_PROMPT)]
+)
+_PROMPT_HASH = hashlib.md5(
+    (_SYSTEM_PROMPT + _EVALUATION_PROMPT).encode()
+).hexdigest()[:8]
+
+
+@lru_cache(maxsize=8)
+def _build_evaluation_chain(model_name: str, temperature: float):
+    # All four dimensions and the overall score come back from this one call
+    llm = get_chat_model(model_name, temperature, json_mode=True)
+    return _PROMPT_TEMPLATE | llm | _PARSER
+
+
+# Parsed evaluator output for exact (evaluator, question, answer) repeats
+_EVALUATION_CACHE = TTLCache(maxsize=1024, ttl=24 * 60 * 60)
+_EVALUATION_CACHE_LOCK = threading.Lock()
+
+# Evaluations currently running, so concurrent identical requests share one call
+_IN_FLIGHT: Dict[Tuple[str, float, str, str], Future] = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+
+class LLMEvaluator:
+    def __init__(
+        self,
+        model_name: str = "gemini-2.5-flash",
+        temperature: float = 0.1,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.semantic_cache = semantic_cache
+        self.cache_stats = {"hits": 0, "misses": 0}
+        self.llm = get_chat_model(model_name, temperature, json_mode=True)
+
+        self.prompt_template = _PROMPT_TEMPLATE
+        self.parser = _PARSER
+        self.chain = _build_evaluation_chain(model_name, temperature)
+
+    def _get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
+
+    def _get_evaluation_prompt(self) -> str:
+        return _EVALUATION_PROMPT
+
     def _get_evaluator_id(self) -> str:
-        prompt_hash = hashlib.md5(
-            (self._get_system_prompt() + self._get_evaluation_prompt()).encode()
-        ).hexdigest()[:8]
-        return f"{self.model_name}-{prompt_hash}"
+        return f"{self.model_name}-{_PROMPT_HASH}"
 
     def evaluate(
         self, question: Question, answer_text: str, state: InterviewState
     ) -> ResponseRecord:
         try:
-            result = self.chain.invoke(
-                {"question_text": question.text, "answer_text": answer_text}
-            )
+            result = self._lookup_cached_evaluation(question, answer_text)
+            if result is None:
+                result = self._invoke_single_flight(question, answer_text)
+
+            return self._build_response_record(question, answer_text, result)
 
-            scores = result.get("scores", {})
-            if "overall" not in scores:
-                scores["overall"] = self._calculate_overall_score(scores)
-
-            return ResponseRecord(
-                question_id=question.id,
-                question_text=question.text,
-                answer_text=answer_text,
-                timestamp=datetime.now(tz=timezone.utc),
-                evaluator_id=self._get_evaluator_id(),
-                scores=scores,
-                rationale=result.get("rationale", ""),
-                deterministic_results={},
+        except Exception as e:
+            logger.error(f"LLM evaluation failed: {e}")
+            return self._create_fallback_response(question, answer_text, str(e))
+
+    async def aevaluate(
+        self, question: Question, answer_text: str, state: InterviewState
+    ) -> ResponseRecord:
+        """Async variant of evaluate that awaits the LLM without blocking the loop"""
+        try:
+            result = await asyncio.to_thread(
+                self._lookup_cached_evaluation, question, answer_text
             )
+            if result is None:
+                result = await self._ainvoke_single_flight(question, answer_text)
+
+            return self._build_response_record(question, answer_text, result)
 
         except Exception as e:
             logger.error(f"LLM evaluation failed: {e}")
             return self._create_fallback_response(question, answer_text, str(e))
 
+    def _join_flight(
+        self, question: Question, answer_text: str
+    ) -> Tuple[Tuple[str, float, str, str], Future, bool]:
+        """Return the shared future for this evaluation and whether we must run it"""
+        key = (self._get_evaluator_id(), self.temperature, question.text, answer_text)
+        with _IN_FLIGHT_LOCK:
+            future = _IN_FLIGHT.get(key)
+            if future is not None:
+                return key, future, False
+            future = _IN_FLIGHT[key] = Future()
+            return key, future, True
+
+    def _finish_flight(self, key: Tuple[str, float, str, str]):
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT.pop(key, None)
+
+    def _invoke_single_flight(
+        self, question: Question, answer_text: str
+    ) -> Dict[str, Any]:
+        key, future, leader = self._join_flight(question, answer_text)
+        if leader:
+            try:
+                result = self.chain.invoke(
+                    {"question_text": question.text, "answer_text": answer_text}
+                )
+                self._store_cached_evaluation(question, answer_text, result)
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException:
+                # A cancelled leader (e.g. the client disconnected) still has to
+                # release its followers, who fall back like any failed evaluation
+                future.set_exception(RuntimeError("Shared evaluation was cancelled"))
+                raise
+            finally:
+                self._finish_flight(key)
+
+        # Callers mutate the scores, so each gets its own copy
+        return copy.deepcopy(future.result())
+
+    async def _ainvoke_single_flight(
+        self, question: Question, answer_text: str
+    ) -> Dict[str, Any]:
+        key, future, leader = self._join_flight(question, answer_text)
+        if leader:
+            try:
+                result = await self.chain.ainvoke(
+                    {"question_text": question.text, "answer_text": answer_text}
+                )
+                await asyncio.to_thread(
+                    self._store_cached_evaluation, question, answer_text, result
+                )
+                future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+            except BaseException:
+                # A cancelled leader (e.g. the client disconnected) still has to
+                # release its followers, who fall back like any failed evaluation
+                future.set_exception(RuntimeError("Shared evaluation was cancelled"))
+                raise
+            finally:
+                self._finish_flight(key)
+
+        return copy.deepcopy(await asyncio.wrap_future(future))
+
+    def _build_response_record(
+        self, question: Question, answer_text: str, result: Dict[str, Any]
+    ) -> ResponseRecord:
+        scores = result.get("scores", {})
+        if "overall" not in scores:
+            scores["overall"] = self._calculate_overall_score(scores)
+
+        return ResponseRecord(
+            question_id=question.id,
+            question_text=question.text,
+            answer_text=answer_text,
+            timestamp=datetime.now(tz=timezone.utc),
+            evaluator_id=self._get_evaluator_id(),
+            scores=scores,
+            rationale=result.get("rationale", ""),
+            deterministic_results={},
+        )
+
+    def _evaluation_cache_key(self, question: Question, answer_text: str) -> str:
+        """Hash the model settings, prompts and inputs that determine an evaluation"""
+        payload = "\x1f".join(
+            (
+                self._get_evaluator_id(),
+                str(self.temperature),
+                question.text,
+                answer_text,
+            )
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _lookup_cached_evaluation(
+        self, question: Question, answer_text: str
+    ) -> Optional[Dict[str, Any]]:
+        """Check the exact-match cache before paying for an embedding lookup"""
+        cache_key = self._evaluation_cache_key(question, answer_text)
+        with _EVALUATION_CACHE_LOCK:
+            cached = _EVALUATION_CACHE.get(cache_key)
+
+        if cached is not None:
+            self.cache_stats["hits"] += 1
+            return copy.deepcopy(cached)
+
+        self.cache_stats["misses"] += 1
+        return self._lookup_similar_evaluation(question, answer_text)
+
+    def _store_cached_evaluation(
+        self, question: Question, answer_text: str, result: Dict[str, Any]
+    ):
+        cache_key = self._evaluation_cache_key(question, answer_text)
+        with _EVALUATION_CACHE_LOCK:
+            _EVALUATION_CACHE[cache_key] = copy.deepcopy(result)
+
+        self._store_similar_evaluation(question, answer_text, result)
+
+    def _lookup_similar_evaluation(
+        self, question: Question, answer_text: str
+    ) -> Optional[Dict[str, Any]]:
+        """Reuse the evaluation of a near-identical answer to the same question"""
+        if self.semantic_cache is None:
+            return None
+
+        try:
+            return self.semantic_cache.lookup(answer_text, bucket=question.text)
+        except Exception as e:
+            logger.warning(f"Semantic evaluation cache lookup failed: {e}")
+            return None
+
+    def _store_similar_evaluation(
+        self, question: Question, answer_text: str, result: Dict[str, Any]
+    ):
+        if self.semantic_cache is None:
+            return
+
+        try:
+            self.semantic_cache.store(answer_text, result, bucket=question.text)
+        except Exception as e:
+            logger.warning(f"Semantic evaluation cache store failed: {e}")
+
     def _calculate_overall_score(self, scores: Dict[str, float]) -> float:
         weights = {
             "correctness": 0.4,
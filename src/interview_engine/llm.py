@@ -0,0 +1,27 @@
+from functools import lru_cache
+
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+
+
+@lru_cache(maxsize=8)
+def get_chat_model(
+    model_name: str, temperature: float, json_mode: bool = False
+) -> ChatGoogleGenerativeAI:
+    """Return the process-wide Gemini chat model for these settings"""
+    # One client per setting means one long-lived HTTP/2 gRPC channel that every
+    # component and session multiplexes over, instead of a handshake per client.
+    if json_mode:
+        # The model is constrained to emit a single JSON object, so nothing
+        # is spent on prose around it and the parser never has to strip it
+        return ChatGoogleGenerativeAI(
+            model=model_name,
+            temperature=temperature,
+            response_mime_type="application/json",
+        )
+    return ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
+
+
+@lru_cache(maxsize=4)
+def get_embeddings_model(model_name: str) -> GoogleGenerativeAIEmbeddings:
+    """Return the process-wide Gemini embeddings client for this model"""
+    return GoogleGenerativeAIEmbeddings(model=model_name)
@@ -1,11 +1,17 @@
-import json
 import os
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+import orjson
+
 from src.interview_engine.models import InterviewState
 
+# orjson writes datetimes as ISO 8601 itself, so states need no pre-pass
+_DUMPS_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+)
+
 
 class Persistence:
     def __init__(self, base_path: str = "sessions"):
@@ -18,11 +24,9 @@ class Persistence:
 
         state_file = session_dir / "state.json"
 
-        state_dict = state.model_dump()
-        self._serialize_datetimes(state_dict)
-
-        with open(state_file, "w", encoding="utf-8") as f:
-            json.dump(state_dict, f, indent=2, ensure_ascii=False, default=str)
+        state_file.write_bytes(
+            orjson.dumps(state.model_dump(), default=str, option=_DUMPS_OPTIONS)
+        )
 
         return str(state_file)
 
@@ -34,8 +38,7 @@ class Persistence:
             return None
 
         try:
-            with open(state_file, "r", encoding="utf-8") as f:
-                state_dict = json.load(f)
+            state_dict = orjson.loads(state_file.read_bytes())
 
             self._deserialize_datetimes(state_dict)
             return InterviewState(**state_dict)
@@ -50,8 +53,9 @@ class Persistence:
 
         report_file = session_dir / "report.json"
 
-        with open(report_file, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        report_file.write_bytes(
+            orjson.dumps(report, default=str, option=_DUMPS_OPTIONS)
+        )
 
         return str(report_file)
 
@@ -70,8 +74,7 @@ class Persistence:
             "raw_response": raw_response,
         }
 
-        with open(response_file, "w", encoding="utf-8") as f:
-            json.dump(response_data, f, indent=2, ensure_ascii=False)
+        response_file.write_bytes(orjson.dumps(response_data, option=_DUMPS_OPTIONS))
 
         return str(response_file)
 
@@ -106,20 +109,6 @@ class Persistence:
 
         return info
 
-    def _serialize_datetimes(self, obj):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, datetime):
-                    obj[key] = value.isoformat()
-                elif isinstance(value, (dict, list)):
-                    self._serialize_datetimes(value)
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                if isinstance(item, datetime):
-                    obj[i] = item.isoformat()
-                elif isinstance(item, (dict, list)):
-                    self._serialize_datetimes(item)
-
     def _deserialize_datetimes(self, obj):
         if isinstance(obj, dict):
             for key, value in obj.items():
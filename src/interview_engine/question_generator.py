@@ -1,33 +1,71 @@
 import logging
+import threading
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import AsyncIterator, NamedTuple, Optional, Union
 
-from langchain_google_genai import ChatGoogleGenerativeAI
+from cachetools import TTLCache
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import Runnable
 
+from src.interview_engine.llm import get_chat_model
 from src.interview_engine.models import Question, InterviewState
 
 logger = logging.getLogger(__name__)
 
-
-class QuestionGenerator:
-    def __init__(self, model_name: str = "gemini-2.5-flash", temperature: float = 0.3):
-        self.model_name = model_name
-        self.temperature = temperature
-        self.llm = ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
-
-        self.prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", self._get_system_prompt()),
-                ("human", self._get_generation_prompt()),
-            ]
-        )
-
-        self.parser = JsonOutputParser()
-        self.chain = self.prompt_template | self.llm | self.parser
-
-    def _get_system_prompt(self) -> str:
-        return """
+_FALLBACK_QUESTIONS = (
+    "How do you approach debugging a complex technical issue?",
+    "Describe a challenging technical project you've worked on recently.",
+    "What's your experience with database optimization?",
+    "How do you ensure code quality in your development process?",
+    "Tell me about your experience with distributed systems.",
+)
+
+_PERFORMANCE_DIMENSIONS = (
+    "correctness",
+    "design",
+    "communication",
+    "production",
+    "overall",
+)
+
+# Asked when the model gives no usable next question
+_FALLBACK_NEXT_RESPONSE = {
+    "text": "Let me start by asking about your Excel experience. How comfortable are you with creating formulas and functions?",
+    "phase_transition": False,
+    "new_phase": None,
+    "coverage_assessment": "Starting with formulas assessment",
+    "reasoning": "Fallback due to JSON parsing error",
+}
+
+# At most this many answered turns are quoted in full; older ones keep only
+# their question, which is enough for the generator to avoid repeating a topic.
+# The window start jumps _HISTORY_WINDOW_STEP turns at a time rather than
+# sliding every turn, so between jumps the history stays append-only and the
+# provider's cached prompt prefix keeps matching.
+_HISTORY_WINDOW = 12
+_HISTORY_WINDOW_STEP = 6
+
+
+@lru_cache(maxsize=4096)
+def _format_history_entry(
+    index: int,
+    question_text: str,
+    answer_text: str,
+    overall_score: Optional[float],
+    rationale: Optional[str],
+) -> str:
+    """Format one answered question; earlier turns are reused as history grows"""
+    parts = [f"Q{index}: {question_text}", f"A{index}: {answer_text}"]
+    if overall_score is not None:
+        parts.append(f"Score: {overall_score:.1f}/5.0 - {rationale}")
+    parts.append("")
+    return "\n".join(parts)
+
+
+_SYSTEM_PROMPT = """
         <system_prompt>
         <role>
             <primary_function>experienced Excel interviewer</primary_function>
@@ -132,29 +170,11 @@ class QuestionGenerator:
         </system_prompt>
         """
 
-    def _get_generation_prompt(self) -> str:
-        return """
+# Per-turn inputs come after the static rubric so the provider can reuse its
+# cached prefix across calls; the append-only history leads them so earlier
+# turns stay part of that prefix too
+_GENERATION_PROMPT = """
         <system_prompt>
-        <interview_context>
-            <current_state>
-            <phase>{phase}</phase>
-            <questions_asked>{questions_count}</questions_asked>
-            <target_questions>{target_questions}</target_questions>
-            </current_state>
-            
-            <conversation_history>
-            {chat_history}
-            </conversation_history>
-            
-            <candidate_analysis>
-            {performance_summary}
-            </candidate_analysis>
-            
-            <timing_status>
-            {time_status}
-            </timing_status>
-        </interview_context>
-
         <interviewer_role>
             <position>experienced Excel interviewer</position>
             <authority>full control over interview flow</authority>
@@ -251,6 +271,26 @@ class QuestionGenerator:
             </pacing_philosophy>
         </time_management>
 
+        <interview_context>
+            <conversation_history>
+            {chat_history}
+            </conversation_history>
+            
+            <current_state>
+            <phase>{phase}</phase>
+            <questions_asked>{questions_count}</questions_asked>
+            <target_questions>{target_questions}</target_questions>
+            </current_state>
+            
+            <candidate_analysis>
+            {performance_summary}
+            </candidate_analysis>
+            
+            <timing_status>
+            {time_status}
+            </timing_status>
+        </interview_context>
+
         <output_requirement>
             <format>specified JSON format</format>
             <instruction>return the question in required JSON structure</instruction>
@@ -258,88 +298,315 @@ class QuestionGenerator:
         </system_prompt>
         """
 
-    def generate_next_response(
-        self, state: InterviewState, time_status: dict = None
-    ) -> dict:
-        try:
-            chat_history = self._format_chat_history(state)
-            performance_summary = self._analyze_performance(state)
+_SCENARIO_SYSTEM_PROMPT = """<interviewer_role>
+              <function>conversational technical interviewer</function>
+              <task>create practical scenario question</task>
+              <personality>
+                <trait>naturally engaging</trait>
+                <trait>genuinely curious</trait>
+                <trait>interested in problem-solving approach</trait>
+              </personality>
+            </interviewer_role>
+
+            <scenario_requirements>
+              <conversation_flow>
+                <acknowledgment>natural acknowledgment of previous responses</acknowledgment>
+                <continuity>feels like natural conversation continuation</continuity>
+                <connection>references or builds upon discussed topics</connection>
+              </conversation_flow>
+              
+              <assessment_goals>
+                <focus>practical problem-solving ability</focus>
+                <thinking>system thinking evaluation</thinking>
+                <presentation>conversational and engaging delivery</presentation>
+              </assessment_goals>
+              
+              <transition_examples>
+                <example>"That's been really helpful! Now I'd like to shift to..."</example>
+                <example>"Great insights so far. Let's try a different kind of question..."</example>
+                <example>"I'm getting a good sense of your background. Now I'm curious how you'd approach..."</example>
+              </transition_examples>
+            </scenario_requirements>
+
+            <output_specification>
+              <format>complete conversational response</format>
+              <components>acknowledgment + scenario question</components>
+              <tone>natural, measured professional interest</tone>
+            </output_specification>"""
+
+_SCENARIO_HUMAN_PROMPT = """<conversation_context>
+              <label>Based on our conversation so far:</label>
+              <content>{chat_history}</content>
+            </conversation_context>
+
+            <candidate_assessment>
+              <label>Candidate insights:</label>
+              <content>{performance_summary}</content>
+            </candidate_assessment>
+
+            <scenario_objectives>
+              <transition_goal>shift to practical scenario</transition_goal>
+              
+              <scenario_criteria>
+                <criterion id="1">builds on topics discussed or demonstrated expertise</criterion>
+                <criterion id="2">tests real-world problem-solving approach</criterion>
+                <criterion id="3">matches their technical level and interests</criterion>
+                <criterion id="4">feels like natural next step in conversation</criterion>
+              </scenario_criteria>
+            </scenario_objectives>
+
+            <creation_instructions>
+              <task>create conversational scenario question</task>
+              <requirements>
+                <reference_previous>reference our previous discussion</reference_previous>
+                <present_challenge>present engaging real-world challenge</present_challenge>
+                <maintain_tone>use measured, curious tone showing genuine interest</maintain_tone>
+              </requirements>
+            </creation_instructions>"""
+
+_REFLECTION_QUESTION_SYSTEM_PROMPT = """<interviewer_role>
+              <function>thoughtful technical interviewer</function>
+              <phase>wrapping up conversational interview</phase>
+              <personality>
+                <trait>supportive and encouraging</trait>
+                <trait>genuinely interested in candidate's growth journey</trait>
+                <trait>mentoring approach</trait>
+              </personality>
+            </interviewer_role>
+
+            <reflection_requirements>
+              <conversation_flow>
+                <acknowledgment>natural acknowledgment of scenario response and overall conversation</acknowledgment>
+                <conclusion>feels like natural, supportive conclusion</conclusion>
+                <connection>references specific topics or insights from discussion</connection>
+              </conversation_flow>
+              
+              <development_focus>
+                <learning>encourage thinking about learning journey</learning>
+                <growth>show genuine interest in professional development</growth>
+                <mentorship>supportive mentor tone</mentorship>
+              </development_focus>
+              
+              <transition_examples>
+                <example>"That was excellent problem-solving! As we wrap up..."</example>
+                <example>"I really appreciate how you worked through that. To close out our conversation..."</example>
+                <example>"Thanks for sharing your approach to that challenge. Before we finish..."</example>
+              </transition_examples>
+            </reflection_requirements>
+
+            <time_awareness>
+              <fifteen_minute_limit>
+                <acknowledgment>acknowledge naturally if time limit reached</acknowledgment>
+                <example>"I notice we've reached our time limit, so let's wrap up with a quick reflection..."</example>
+                <example>"Time flies when you're having a good technical discussion! Let's close with..."</example>
+              </fifteen_minute_limit>
+            </time_awareness>
+
+            <output_specification>
+              <format>complete conversational response</format>
+              <components>acknowledgment + reflection question</components>
+              <tone>warm, encouraging, supportive mentor</tone>
+            </output_specification>"""
+
+_REFLECTION_QUESTION_HUMAN_PROMPT = """<conversation_context>
+              <label>Based on our wonderful conversation:</label>
+              <content>{chat_history}</content>
+            </conversation_context>
+
+            <timing_context>
+              <label>Interview timing:</label>
+              <content>{time_status}</content>
+            </timing_context>
+
+            <reflection_objectives>
+              <wrap_up_goal>end on reflective note</wrap_up_goal>
+              
+              <development_areas>
+                <area id="1">their learning and development journey</area>
+                <area id="2">areas they're excited to grow in (perhaps inspired by our discussion)</area>
+                <area id="3">their technical interests and where they want to head next</area>
+              </development_areas>
+            </reflection_objectives>
+
+            <creation_instructions>
+              <task>create warm, encouraging reflection question</task>
+              <requirements>
+                <reference_conversation>reference our conversation</reference_conversation>
+                <show_interest>show genuine interest in their growth</show_interest>
+                <mentoring_tone>feel like supportive mentor asking about development goals</mentoring_tone>
+              </requirements>
+            </creation_instructions>"""
+
+_REFLECTION_RESPONSE_SYSTEM_PROMPT = """<interviewer_role>
+              <function>thoughtful technical interviewer</function>
+              <phase>wrapping up conversational interview</phase>
+              <personality>
+                <trait>supportive and encouraging</trait>
+                <trait>genuinely interested in candidate's growth journey</trait>
+                <trait>mentoring approach</trait>
+              </personality>
+            </interviewer_role>
+
+            <reflection_requirements>
+              <conversation_flow>
+                <acknowledgment>natural acknowledgment of scenario response and overall conversation</acknowledgment>
+                <conclusion>feels like natural, supportive conclusion</conclusion>
+                <connection>references specific topics or insights from discussion</connection>
+              </conversation_flow>
+              
+              <development_focus>
+                <learning>encourage thinking about learning journey</learning>
+                <growth>show genuine interest in professional development</growth>
+                <mentorship>supportive mentor tone</mentorship>
+              </development_focus>
+              
+              <transition_examples>
+                <example>"That was excellent problem-solving! As we wrap up..."</example>
+                <example>"I really appreciate how you worked through that. To close out our conversation..."</example>
+                <example>"Thanks for sharing your approach to that challenge. Before we finish..."</example>
+              </transition_examples>
+            </reflection_requirements>
+
+            <time_awareness>
+              <fifteen_minute_limit>
+                <acknowledgment>acknowledge naturally if time limit reached</acknowledgment>
+                <example>"I notice we've reached our time limit, so let's wrap up with a quick reflection..."</example>
+                <example>"Time flies when you're having a good technical discussion! Let's close with..."</example>
+              </fifteen_minute_limit>
+            </time_awareness>
+
+            <output_specification>
+              <format>complete conversational response</format>
+              <components>acknowledgment + reflection question</components>
+              <tone>warm, encouraging, supportive mentor</tone>
+            </output_specification>"""
+
+_REFLECTION_RESPONSE_HUMAN_PROMPT = """<conversation_context>
+              <label>Based on our wonderful conversation:</label>
+              <content>{chat_history}</content>
+            </conversation_context>
+
+            <timing_context>
+              <label>Interview timing:</label>
+              <content>{time_status}</content>
+            </timing_context>
+
+            <reflection_objectives>
+              <wrap_up_goal>end on reflective note</wrap_up_goal>
+              
+              <development_areas>
+                <area id="1">their learning and development journey</area>
+                <area id="2">areas they're excited to grow in (perhaps inspired by our discussion)</area>
+                <area id="3">their technical interests and where they want to head next</area>
+              </development_areas>
+            </reflection_objectives>
+
+            <creation_instructions>
+              <task>create warm, encouraging reflection question</task>
+              <requirements>
+                <reference_conversation>reference our conversation</reference_conversation>
+                <show_interest>show genuine interest in their growth</show_interest>
+                <mentoring_tone>feel like supportive mentor asking about development goals</mentoring_tone>
+              </requirements>
+            </creation_instructions>"""
+
+# Prompt templates are parsed once at import; only the per-call variables vary
+_PARSER = JsonOutputParser()
+_GENERATION_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [("system", _SYSTEM_PROMPT), ("human", _GENERATION_PROMPT)]
+)
+_SCENARIO_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [("system", _SCENARIO_SYSTEM_PROMPT), ("human", _SCENARIO_HUMAN_PROMPT)]
+)
+_REFLECTION_QUESTION_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", _REFLECTION_QUESTION_SYSTEM_PROMPT),
+        ("human", _REFLECTION_QUESTION_HUMAN_PROMPT),
+    ]
+)
+_REFLECTION_RESPONSE_PROMPT_TEMPLATE = ChatPromptTemplate.from_messages(
+    [
+        ("system", _REFLECTION_RESPONSE_SYSTEM_PROMPT),
+        ("human", _REFLECTION_RESPONSE_HUMAN_PROMPT),
+    ]
+)
+
+
+class _GeneratorChains(NamedTuple):
+    generation: Runnable
+    generation_raw: Runnable
+    scenario: Runnable
+    reflection_question: Runnable
+    reflection_response: Runnable
+
+
+@lru_cache(maxsize=8)
+def _build_generator_chains(model_name: str, temperature: float) -> _GeneratorChains:
+    """Compose the generator's runnables once per model setting, not per instance"""
+    llm = get_chat_model(model_name, temperature)
+    return _GeneratorChains(
+        generation=_GENERATION_PROMPT_TEMPLATE | llm | _PARSER,
+        generation_raw=_GENERATION_PROMPT_TEMPLATE | llm,
+        scenario=_SCENARIO_PROMPT_TEMPLATE | llm,
+        reflection_question=_REFLECTION_QUESTION_PROMPT_TEMPLATE | llm,
+        reflection_response=_REFLECTION_RESPONSE_PROMPT_TEMPLATE | llm | _PARSER,
+    )
+
+
+# The opening question is generated from the same empty-interview prompt for
+# every session, so one LLM result is shared per model setting for a while
+_OPENING_RESPONSE_CACHE = TTLCache(maxsize=16, ttl=60 * 60)
+_OPENING_RESPONSE_CACHE_LOCK = threading.Lock()
+
+
+class QuestionGenerator:
+    def __init__(self, model_name: str = "gemini-2.5-flash", temperature: float = 0.3):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.llm = get_chat_model(model_name, temperature)
+
+        self.prompt_template = _GENERATION_PROMPT_TEMPLATE
+        self.parser = _PARSER
+
+        chains = _build_generator_chains(model_name, temperature)
+        self.chain = chains.generation
+        self.raw_chain = chains.generation_raw
+        self.scenario_chain = chains.scenario
+        self.reflection_question_chain = chains.reflection_question
+        self.reflection_response_chain = chains.reflection_response
+
+    def _get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
 
-            if time_status is None:
-                current_time = datetime.now(tz=timezone.utc)
-                elapsed = current_time - state.start_time
-                elapsed_minutes = elapsed.total_seconds() / 60.0
-                time_status = {
-                    "elapsed_minutes": elapsed_minutes,
-                    "remaining_minutes": max(0, 15 - elapsed_minutes),
-                    "time_up": elapsed_minutes >= 15,
-                    "time_warning": elapsed_minutes >= 12,
-                }
+    def _get_generation_prompt(self) -> str:
+        return _GENERATION_PROMPT
 
-            try:
-                formatted_time_status = self._format_time_status(time_status)
-            except Exception as e:
-                logger.error(f"Error formatting time status: {e}")
-                formatted_time_status = "Time status unavailable"
-
-            template_vars = {
-                "phase": str(state.phase or "qa"),
-                "questions_count": len(state.responses or []),
-                "target_questions": "No fixed target - you decide when enough coverage is achieved",
-                "chat_history": str(
-                    chat_history
-                    or "No previous responses yet - this is the first question."
-                ),
-                "performance_summary": str(
-                    performance_summary or "Starting interview assessment"
-                ),
-                "time_status": formatted_time_status,
-            }
+    def generate_next_response(
+        self, state: InterviewState, time_status: dict = None
+    ) -> dict:
+        cached = self._get_cached_opening_response(state)
+        if cached is not None:
+            return self._finalize_next_response(state, cached)
 
-            logger.debug(f"Template variables: {template_vars}")
+        try:
+            template_vars = self._build_generation_vars(state, time_status)
 
             try:
                 result = self.chain.invoke(template_vars)
+                self._store_opening_response(state, result)
             except Exception as parse_error:
                 logger.error(f"JSON parsing failed: {parse_error}")
                 try:
-                    raw_chain = self.prompt_template | self.llm
-                    raw_result = raw_chain.invoke(template_vars)
+                    raw_result = self.raw_chain.invoke(template_vars)
                     logger.error(
                         f"Raw LLM response that failed to parse: {raw_result.content}"
                     )
                     result = self._validate_and_fix_json_response(raw_result.content)
                 except Exception as e:
                     logger.error(f"Could not get or fix raw response: {e}")
-                    result = {
-                        "text": "Let me start by asking about your Excel experience. How comfortable are you with creating formulas and functions?",
-                        "phase_transition": False,
-                        "new_phase": None,
-                        "coverage_assessment": "Starting with formulas assessment",
-                        "reasoning": "Fallback due to JSON parsing error",
-                    }
-
-            if not result.get("phase_transition", False):
-                question_id = f"q{len(state.responses) + 1}"
-                question = Question(
-                    id=question_id,
-                    text=result.get("text", "Tell me about your Excel experience."),
-                    type="qa",
-                    metadata={
-                        "coverage_assessment": result.get("coverage_assessment", ""),
-                        "reasoning": result.get("reasoning", "Generated dynamically"),
-                        "generated_at": datetime.now(tz=timezone.utc).isoformat(),
-                    },
-                )
-                state.questions.append(question)
+                    result = dict(_FALLBACK_NEXT_RESPONSE)
 
-            return {
-                "text": result.get("text", "Let me ask about your Excel experience."),
-                "phase_transition": result.get("phase_transition", False),
-                "new_phase": result.get("new_phase"),
-                "coverage_assessment": result.get("coverage_assessment", ""),
-                "reasoning": result.get("reasoning", ""),
-            }
+            return self._finalize_next_response(state, result)
 
         except Exception as e:
             logger.error(f"Failed to generate response: {e}")
@@ -351,22 +618,165 @@ class QuestionGenerator:
                 "reasoning": "Fallback question due to generation error",
             }
 
+    async def astream_next_response(
+        self, state: InterviewState, time_status: dict = None
+    ) -> AsyncIterator[Union[str, dict]]:
+        """Yield the reply text as it streams in, then the full response dict"""
+        cached = self._get_cached_opening_response(state)
+        if cached is not None:
+            yield cached["text"]
+            yield self._finalize_next_response(state, cached)
+            return
+
+        result = {}
+        try:
+            template_vars = self._build_generation_vars(state, time_status)
+
+            async for result in self.chain.astream(template_vars):
+                text = result.get("text") if isinstance(result, dict) else None
+                if text:
+                    yield text
+
+        except Exception as e:
+            # The model call itself failed; retrying it would only make the
+            # candidate wait out another timeout before the same fallback
+            logger.error(f"Streaming response failed: {e}")
+            yield self._finalize_next_response(state, dict(_FALLBACK_NEXT_RESPONSE))
+            return
+
+        if not isinstance(result, dict) or not result.get("text"):
+            yield await self._arepair_next_response(state, template_vars)
+            return
+
+        self._store_opening_response(state, result)
+        yield self._finalize_next_response(state, result)
+
+    async def _arepair_next_response(
+        self, state: InterviewState, template_vars: dict
+    ) -> dict:
+        """Salvage unparseable output with one raw call, else ask the fallback"""
+        try:
+            raw_result = await self.raw_chain.ainvoke(template_vars)
+            logger.error(f"Raw LLM response that failed to parse: {raw_result.content}")
+            result = self._validate_and_fix_json_response(raw_result.content)
+        except Exception as e:
+            logger.error(f"Could not get or fix raw response: {e}")
+            result = dict(_FALLBACK_NEXT_RESPONSE)
+
+        return self._finalize_next_response(state, result)
+
+    def _get_cached_opening_response(self, state: InterviewState) -> Optional[dict]:
+        if state.responses:
+            return None
+
+        with _OPENING_RESPONSE_CACHE_LOCK:
+            cached = _OPENING_RESPONSE_CACHE.get((self.model_name, self.temperature))
+        return dict(cached) if cached is not None else None
+
+    def _store_opening_response(self, state: InterviewState, result: dict):
+        if (
+            state.responses
+            or not isinstance(result, dict)
+            or not result.get("text")
+            or result.get("phase_transition")
+        ):
+            return
+
+        with _OPENING_RESPONSE_CACHE_LOCK:
+            _OPENING_RESPONSE_CACHE[(self.model_name, self.temperature)] = dict(result)
+
+    def _build_generation_vars(
+        self, state: InterviewState, time_status: dict = None
+    ) -> dict:
+        chat_history = self._format_chat_history(state)
+        performance_summary = self._analyze_performance(state)
+
+        if time_status is None:
+            current_time = datetime.now(tz=timezone.utc)
+            elapsed = current_time - state.start_time
+            elapsed_minutes = elapsed.total_seconds() / 60.0
+            time_status = {
+                "elapsed_minutes": elapsed_minutes,
+                "remaining_minutes": max(0, 15 - elapsed_minutes),
+                "time_up": elapsed_minutes >= 15,
+                "time_warning": elapsed_minutes >= 12,
+            }
+
+        try:
+            formatted_time_status = self._format_time_status(time_status)
+        except Exception as e:
+            logger.error(f"Error formatting time status: {e}")
+            formatted_time_status = "Time status unavailable"
+
+        template_vars = {
+            "phase": str(state.phase or "qa"),
+            "questions_count": len(state.responses or []),
+            "target_questions": "No fixed target - you decide when enough coverage is achieved",
+            "chat_history": str(
+                chat_history
+                or "No previous responses yet - this is the first question."
+            ),
+            "performance_summary": str(
+                performance_summary or "Starting interview assessment"
+            ),
+            "time_status": formatted_time_status,
+        }
+
+        logger.debug(f"Template variables: {template_vars}")
+        return template_vars
+
+    def _finalize_next_response(self, state: InterviewState, result: dict) -> dict:
+        """Record the generated question on the state and normalize the response"""
+        if not result.get("phase_transition", False):
+            question_id = f"q{len(state.responses) + 1}"
+            question = Question(
+                id=question_id,
+                text=result.get("text", "Tell me about your Excel experience."),
+                type="qa",
+                metadata={
+                    "coverage_assessment": result.get("coverage_assessment", ""),
+                    "reasoning": result.get("reasoning", "Generated dynamically"),
+                    "generated_at": datetime.now(tz=timezone.utc).isoformat(),
+                },
+            )
+            state.questions.append(question)
+
+        return {
+            "text": result.get("text", "Let me ask about your Excel experience."),
+            "phase_transition": result.get("phase_transition", False),
+            "new_phase": result.get("new_phase"),
+            "coverage_assessment": result.get("coverage_assessment", ""),
+            "reasoning": result.get("reasoning", ""),
+        }
+
     def _format_chat_history(self, state: InterviewState) -> str:
         if not state.responses:
             return "No previous responses yet - this is the first question."
 
-        history_parts = []
-        for i, response in enumerate(state.responses, 1):
-            history_parts.append(f"Q{i}: {response.question_text}")
-            history_parts.append(f"A{i}: {response.answer_text}")
-            if response.scores and response.rationale:
-                overall_score = response.scores.get("overall", 0)
-                history_parts.append(
-                    f"Score: {overall_score:.1f}/5.0 - {response.rationale}"
-                )
-            history_parts.append("")
-
-        return "\n".join(history_parts)
+        overflow = max(len(state.responses) - _HISTORY_WINDOW, 0)
+        window_start = -(-overflow // _HISTORY_WINDOW_STEP) * _HISTORY_WINDOW_STEP
+        entries = [
+            f"Q{i}: {response.question_text}"
+            for i, response in enumerate(islice(state.responses, window_start), 1)
+        ]
+        if entries:
+            entries.append("")
+
+        entries.extend(
+            _format_history_entry(
+                i,
+                response.question_text,
+                response.answer_text,
+                response.scores.get("overall", 0)
+                if response.scores and response.rationale
+                else None,
+                response.rationale,
+            )
+            for i, response in enumerate(
+                islice(state.responses, window_start, None), window_start + 1
+            )
+        )
+        return "\n".join(entries)
 
     def _analyze_performance(self, state: InterviewState) -> str:
         if not state.responses:
@@ -375,18 +785,19 @@ class QuestionGenerator:
         total_responses = len(state.responses)
         latest_response = state.responses[-1] if state.responses else None
 
-        avg_scores = {}
-        score_dimensions = [
-            "correctness",
-            "design",
-            "communication",
-            "production",
-            "overall",
-        ]
+        # Fold every dimension in one pass over the responses
+        score_totals = dict.fromkeys(_PERFORMANCE_DIMENSIONS, 0)
+        scored_count = 0
+        for response in state.responses:
+            if response.scores:
+                scored_count += 1
+                for dim in _PERFORMANCE_DIMENSIONS:
+                    score_totals[dim] += response.scores.get(dim, 0)
 
-        for dim in score_dimensions:
-            scores = [r.scores.get(dim, 0) for r in state.responses if r.scores]
-            avg_scores[dim] = sum(scores) / len(scores) if scores else 0
+        avg_scores = {
+            dim: total / scored_count if scored_count else 0
+            for dim, total in score_totals.items()
+        }
 
         strengths = []
         weaknesses = []
@@ -403,16 +814,17 @@ class QuestionGenerator:
         categories_covered = set()
         difficulty_trend = []
 
-        for i, response in enumerate(state.responses):
-            if hasattr(response, "question_text"):
-                for question in state.questions:
-                    if question.text == response.question_text and question.metadata:
-                        categories_covered.add(
-                            question.metadata.get("category", "general")
-                        )
-                        difficulty_trend.append(
-                            question.metadata.get("difficulty", "intermediate")
-                        )
+        # Index asked questions by text once instead of rescanning per response
+        question_metadata = {
+            question.text: question.metadata
+            for question in state.questions
+            if question.metadata
+        }
+        for response in state.responses:
+            metadata = question_metadata.get(response.question_text)
+            if metadata:
+                categories_covered.add(metadata.get("category", "general"))
+                difficulty_trend.append(metadata.get("difficulty", "intermediate"))
 
         last_question_difficulty = (
             difficulty_trend[-1] if difficulty_trend else "intermediate"
@@ -521,16 +933,8 @@ class QuestionGenerator:
             }
 
     def _create_fallback_question(self, state: InterviewState) -> Question:
-        fallback_questions = [
-            "How do you approach debugging a complex technical issue?",
-            "Describe a challenging technical project you've worked on recently.",
-            "What's your experience with database optimization?",
-            "How do you ensure code quality in your development process?",
-            "Tell me about your experience with distributed systems.",
-        ]
-
-        question_index = len(state.responses) % len(fallback_questions)
-        question_text = fallback_questions[question_index]
+        question_index = len(state.responses) % len(_FALLBACK_QUESTIONS)
+        question_text = _FALLBACK_QUESTIONS[question_index]
 
         return Question(
             id=f"fallback_q{len(state.responses) + 1}",
@@ -546,86 +950,10 @@ class QuestionGenerator:
 
     def generate_scenario_question(self, state: InterviewState) -> str:
         try:
-            scenario_prompt = ChatPromptTemplate.from_messages(
-                [
-                    (
-                        "system",
-                        """<interviewer_role>
-              <function>conversational technical interviewer</function>
-              <task>create practical scenario question</task>
-              <personality>
-                <trait>naturally engaging</trait>
-                <trait>genuinely curious</trait>
-                <trait>interested in problem-solving approach</trait>
-              </personality>
-            </interviewer_role>
-
-            <scenario_requirements>
-              <conversation_flow>
-                <acknowledgment>natural acknowledgment of previous responses</acknowledgment>
-                <continuity>feels like natural conversation continuation</continuity>
-                <connection>references or builds upon discussed topics</connection>
-              </conversation_flow>
-              
-              <assessment_goals>
-                <focus>practical problem-solving ability</focus>
-                <thinking>system thinking evaluation</thinking>
-                <presentation>conversational and engaging delivery</presentation>
-              </assessment_goals>
-              
-              <transition_examples>
-                <example>"That's been really helpful! Now I'd like to shift to..."</example>
-                <example>"Great insights so far. Let's try a different kind of question..."</example>
-                <example>"I'm getting a good sense of your background. Now I'm curious how you'd approach..."</example>
-              </transition_examples>
-            </scenario_requirements>
-
-            <output_specification>
-              <format>complete conversational response</format>
-              <components>acknowledgment + scenario question</components>
-              <tone>natural, measured professional interest</tone>
-            </output_specification>""",
-                    ),
-                    (
-                        "human",
-                        """<conversation_context>
-              <label>Based on our conversation so far:</label>
-              <content>{chat_history}</content>
-            </conversation_context>
-
-            <candidate_assessment>
-              <label>Candidate insights:</label>
-              <content>{performance_summary}</content>
-            </candidate_assessment>
-
-            <scenario_objectives>
-              <transition_goal>shift to practical scenario</transition_goal>
-              
-              <scenario_criteria>
-                <criterion id="1">builds on topics discussed or demonstrated expertise</criterion>
-                <criterion id="2">tests real-world problem-solving approach</criterion>
-                <criterion id="3">matches their technical level and interests</criterion>
-                <criterion id="4">feels like natural next step in conversation</criterion>
-              </scenario_criteria>
-            </scenario_objectives>
-
-            <creation_instructions>
-              <task>create conversational scenario question</task>
-              <requirements>
-                <reference_previous>reference our previous discussion</reference_previous>
-                <present_challenge>present engaging real-world challenge</present_challenge>
-                <maintain_tone>use measured, curious tone showing genuine interest</maintain_tone>
-              </requirements>
-            </creation_instructions>""",
-                    ),
-                ]
-            )
-            scenario_chain = scenario_prompt | self.llm
-
             chat_history = self._format_chat_history(state)
             performance_summary = self._analyze_performance(state)
 
-            result = scenario_chain.invoke(
+            result = self.scenario_chain.invoke(
                 {
                     "chat_history": chat_history,
                     "performance_summary": performance_summary,
@@ -646,90 +974,6 @@ I'm curious: how would you approach diagnosing and fixing this performance issue
         self, state: InterviewState, time_status: dict = None
     ) -> str:
         try:
-            reflection_prompt = ChatPromptTemplate.from_messages(
-                [
-                    (
-                        "system",
-                        """<interviewer_role>
-              <function>thoughtful technical interviewer</function>
-              <phase>wrapping up conversational interview</phase>
-              <personality>
-                <trait>supportive and encouraging</trait>
-                <trait>genuinely interested in candidate's growth journey</trait>
-                <trait>mentoring approach</trait>
-              </personality>
-            </interviewer_role>
-
-            <reflection_requirements>
-              <conversation_flow>
-                <acknowledgment>natural acknowledgment of scenario response and overall conversation</acknowledgment>
-                <conclusion>feels like natural, supportive conclusion</conclusion>
-                <connection>references specific topics or insights from discussion</connection>
-              </conversation_flow>
-              
-              <development_focus>
-                <learning>encourage thinking about learning journey</learning>
-                <growth>show genuine interest in professional development</growth>
-                <mentorship>supportive mentor tone</mentorship>
-              </development_focus>
-              
-              <transition_examples>
-                <example>"That was excellent problem-solving! As we wrap up..."</example>
-                <example>"I really appreciate how you worked through that. To close out our conversation..."</example>
-                <example>"Thanks for sharing your approach to that challenge. Before we finish..."</example>
-              </transition_examples>
-            </reflection_requirements>
-
-            <time_awareness>
-              <fifteen_minute_limit>
-                <acknowledgment>acknowledge naturally if time limit reached</acknowledgment>
-                <example>"I notice we've reached our time limit, so let's wrap up with a quick reflection..."</example>
-                <example>"Time flies when you're having a good technical discussion! Let's close with..."</example>
-              </fifteen_minute_limit>
-            </time_awareness>
-
-            <output_specification>
-              <format>complete conversational response</format>
-              <components>acknowledgment + reflection question</components>
-              <tone>warm, encouraging, supportive mentor</tone>
-            </output_specification>""",
-                    ),
-                    (
-                        "human",
-                        """<conversation_context>
-              <label>Based on our wonderful conversation:</label>
-              <content>{chat_history}</content>
-            </conversation_context>
-
-            <timing_context>
-              <label>Interview timing:</label>
-              <content>{time_status}</content>
-            </timing_context>
-
-            <reflection_objectives>
-              <wrap_up_goal>end on reflective note</wrap_up_goal>
-              
-              <development_areas>
-                <area id="1">their learning and development journey</area>
-                <area id="2">areas they're excited to grow in (perhaps inspired by our discussion)</area>
-                <area id="3">their technical interests and where they want to head next</area>
-              </development_areas>
-            </reflection_objectives>
-
-            <creation_instructions>
-              <task>create warm, encouraging reflection question</task>
-              <requirements>
-                <reference_conversation>reference our conversation</reference_conversation>
-                <show_interest>show genuine interest in their growth</show_interest>
-                <mentoring_tone>feel like supportive mentor asking about development goals</mentoring_tone>
-              </requirements>
-            </creation_instructions>""",
-                    ),
-                ]
-            )
-
-            reflection_chain = reflection_prompt | self.llm
-
             chat_history = self._format_chat_history(state)
 
             if time_status is None:
@@ -745,7 +989,7 @@ I'm curious: how would you approach diagnosing and fixing this performance issue
                     "time_warning": elapsed_minutes >= 12,
                 }
 
-            result = reflection_chain.invoke(
+            result = self.reflection_question_chain.invoke(
                 {
                     "chat_history": chat_history,
                     "time_status": self._format_time_status(time_status),
@@ -769,89 +1013,6 @@ I'd love to hear not just what you want to learn, but also how you're thinking a
         try:
             from datetime import datetime, timezone
 
-            reflection_prompt = ChatPromptTemplate.from_messages(
-                [
-                    (
-                        "system",
-                        """<interviewer_role>
-              <function>thoughtful technical interviewer</function>
-              <phase>wrapping up conversational interview</phase>
-              <personality>
-                <trait>supportive and encouraging</trait>
-                <trait>genuinely interested in candidate's growth journey</trait>
-                <trait>mentoring approach</trait>
-              </personality>
-            </interviewer_role>
-
-            <reflection_requirements>
-              <conversation_flow>
-                <acknowledgment>natural acknowledgment of scenario response and overall conversation</acknowledgment>
-                <conclusion>feels like natural, supportive conclusion</conclusion>
-                <connection>references specific topics or insights from discussion</connection>
-              </conversation_flow>
-              
-              <development_focus>
-                <learning>encourage thinking about learning journey</learning>
-                <growth>show genuine interest in professional development</growth>
-                <mentorship>supportive mentor tone</mentorship>
-              </development_focus>
-              
-              <transition_examples>
-                <example>"That was excellent problem-solving! As we wrap up..."</example>
-                <example>"I really appreciate how you worked through that. To close out our conversation..."</example>
-                <example>"Thanks for sharing your approach to that challenge. Before we finish..."</example>
-              </transition_examples>
-            </reflection_requirements>
-
-            <time_awareness>
-              <fifteen_minute_limit>
-                <acknowledgment>acknowledge naturally if time limit reached</acknowledgment>
-                <example>"I notice we've reached our time limit, so let's wrap up with a quick reflection..."</example>
-                <example>"Time flies when you're having a good technical discussion! Let's close with..."</example>
-              </fifteen_minute_limit>
-            </time_awareness>
-
-            <output_specification>
-              <format>complete conversational response</format>
-              <components>acknowledgment + reflection question</components>
-              <tone>warm, encouraging, supportive mentor</tone>
-            </output_specification>""",
-                    ),
-                    (
-                        "human",
-                        """<conversation_context>
-              <label>Based on our wonderful conversation:</label>
-              <content>{chat_history}</content>
-            </conversation_context>
-
-            <timing_context>
-              <label>Interview timing:</label>
-              <content>{time_status}</content>
-            </timing_context>
-
-            <reflection_objectives>
-              <wrap_up_goal>end on reflective note</wrap_up_goal>
-              
-              <development_areas>
-                <area id="1">their learning and development journey</area>
-                <area id="2">areas they're excited to grow in (perhaps inspired by our discussion)</area>
-                <area id="3">their technical interests and where they want to head next</area>
-              </development_areas>
-            </reflection_objectives>
-
-            <creation_instructions>
-              <task>create warm, encouraging reflection question</task>
-              <requirements>
-                <reference_conversation>reference our conversation</reference_conversation>
-                <show_interest>show genuine interest in their growth</show_interest>
-                <mentoring_tone>feel like supportive mentor asking about development goals</mentoring_tone>
-              </requirements>
-            </creation_instructions>""",
-                    ),
-                ]
-            )
-            reflection_chain = reflection_prompt | self.llm | self.parser
-
             chat_history = self._format_chat_history(state)
 
             if time_status is None:
@@ -865,7 +1026,7 @@ I'd love to hear not just what you want to learn, but also how you're thinking a
                     "time_warning": elapsed_minutes >= 12,
                 }
 
-            result = reflection_chain.invoke(
+            result = self.reflection_response_chain.invoke(
                 {
                     "chat_history": chat_history,
                     "time_status": self._format_time_status(time_status),
@@ -1,49 +1,52 @@
-import statistics
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+from bisect import bisect_right
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count, islice
+import asyncio
+import copy
 import datetime
+import hashlib
+import io
 import os
 import tempfile
+import threading
 import logging
 
+import numpy as np
+import orjson
+from cachetools import LRUCache, TTLCache
+from jinja2 import BaseLoader, Environment
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.colors import HexColor
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import (
+    Flowable,
+    SimpleDocTemplate,
+    Paragraph,
+    Preformatted,
+    Spacer,
+    Table,
+    TableStyle,
+)
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 
+from src.interview_engine.llm import get_chat_model
 from src.interview_engine.models import InterviewState, ResponseRecord
+from src.interview_engine.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+_UTC = datetime.timezone.utc
 
-class Reporter:
-    def __init__(self, model_name: str = "gemini-2.5-flash", temperature: float = 0.3):
-        self.score_dimensions = ["correctness", "design", "communication", "production"]
-        self.weights = {
-            "correctness": 0.4,
-            "design": 0.3,
-            "communication": 0.2,
-            "production": 0.1,
-        }
-
-        self.llm = ChatGoogleGenerativeAI(model=model_name, temperature=temperature)
-        self.parser = JsonOutputParser()
-
-        self.report_prompt_template = ChatPromptTemplate.from_messages(
-            [
-                ("system", self._get_report_generation_system_prompt()),
-                ("human", self._get_report_generation_prompt()),
-            ]
-        )
-        self.report_chain = self.report_prompt_template | self.llm | self.parser
 
-    def _get_report_generation_system_prompt(self) -> str:
-        return """
+_REPORT_SYSTEM_PROMPT = """
         <system_prompt>
         <role>
             <primary_function>Excel Skills Interview Report Generator</primary_function>
@@ -136,10 +139,21 @@ class Reporter:
         </system_prompt>
         """
 
-    def _get_report_generation_prompt(self) -> str:
-        return """
+# Static instructions come before the per-session data so consecutive
+# report requests share the longest possible prefix for Gemini's implicit
+# prompt caching.
+_REPORT_HUMAN_PROMPT = """
         Generate a comprehensive constructive feedback report for this Excel skills interview.
 
+        <analysis_requirements>
+        1. Analyze the candidate's Excel knowledge across all four dimensions
+        2. Identify specific strengths and areas for improvement
+        3. Consider the progression of performance throughout the interview
+        4. Generate personalized learning recommendations based on demonstrated skills
+        5. Provide actionable next steps appropriate to the candidate's level
+        6. Ensure all feedback is constructive, specific, and Excel-focused
+        </analysis_requirements>
+
         <interview_data>
         <session_info>
         Session ID: {session_id}
@@ -160,71 +174,622 @@ class Reporter:
         </detailed_responses>
         </interview_data>
 
-        <analysis_requirements>
-        1. Analyze the candidate's Excel knowledge across all four dimensions
-        2. Identify specific strengths and areas for improvement
-        3. Consider the progression of performance throughout the interview
-        4. Generate personalized learning recommendations based on demonstrated skills
-        5. Provide actionable next steps appropriate to the candidate's level
-        6. Ensure all feedback is constructive, specific, and Excel-focused
-        </analysis_requirements>
-
         Generate the JSON report following the exact schema provided in the system prompt.
         """
 
+
+_PARSER = JsonOutputParser()
+
+# Shared across reports so worker threads are started once, on first use.
+_FEEDBACK_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="report-feedback"
+)
+
+_REPORT_CACHE = TTLCache(maxsize=1024, ttl=3600)
+_REPORT_CACHE_LOCK = threading.Lock()
+
+# Rendered markdown and PDF paths, keyed by a hash of the report dict
+_RENDERED_REPORT_CACHE = LRUCache(maxsize=32)
+_RENDERED_REPORT_CACHE_LOCK = threading.Lock()
+
+# Distinguishes PDFs written to the shared temp dir by this process
+_PDF_COUNTER = count()
+
+
+_HASH_DUMPS_OPTIONS = (
+    orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+)
+
+
+def _rendered_report_key(kind: str, report: Dict[str, Any]) -> Tuple[str, str]:
+    payload = orjson.dumps(report, default=str, option=_HASH_DUMPS_OPTIONS)
+    return kind, hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=8)
+def _build_report_chain(model_name: str, temperature: float):
+    llm = get_chat_model(model_name, temperature)
+    prompt_template = ChatPromptTemplate.from_messages(
+        [
+            ("system", _REPORT_SYSTEM_PROMPT),
+            ("human", _REPORT_HUMAN_PROMPT),
+        ]
+    )
+    return prompt_template | llm | _PARSER
+
+
+@lru_cache(maxsize=4096)
+def _format_response_for_prompt(
+    index: int,
+    question_text: str,
+    answer_text: str,
+    correctness: float,
+    design: float,
+    communication: float,
+    production: float,
+    overall: float,
+    rationale: Optional[str],
+) -> str:
+    response_text = f"""
+            <response_{index}>
+            <question>{question_text}</question>
+            <answer>{answer_text}</answer>
+            <scores>
+                Correctness: {correctness:.1f}/5.0
+                Design: {design:.1f}/5.0
+                Communication: {communication:.1f}/5.0
+                Production: {production:.1f}/5.0
+                Overall: {overall:.1f}/5.0
+            </scores>
+            <evaluator_feedback>{rationale}</evaluator_feedback>
+            </response_{index}>
+            """
+    return response_text.strip()
+
+
+# ReportLab styles are read-only once built, so they are shared across reports
+_PDF_STYLES = getSampleStyleSheet()
+_NORMAL_STYLE = _PDF_STYLES["Normal"]
+_ITALIC_STYLE = _PDF_STYLES["Italic"]
+_CODE_STYLE = _PDF_STYLES["Code"]
+
+_TITLE_STYLE = ParagraphStyle(
+    "CustomTitle",
+    parent=_PDF_STYLES["Heading1"],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=HexColor("#2E86AB"),
+    alignment=1,
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    "CustomHeading",
+    parent=_PDF_STYLES["Heading2"],
+    fontSize=16,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=HexColor("#A23B72"),
+)
+
+_SUBHEADING_STYLE = ParagraphStyle(
+    "CustomSubHeading",
+    parent=_PDF_STYLES["Heading3"],
+    fontSize=14,
+    spaceAfter=8,
+    spaceBefore=12,
+    textColor=HexColor("#F18F01"),
+)
+
+
+_SKILL_DIMENSIONS = ("correctness", "design", "communication", "production")
+_REPORT_SCORE_DIMENSIONS = _SKILL_DIMENSIONS + ("overall",)
+
+_TEXT_REPORT_LIST_SECTIONS = (
+    ("## ✅ Strengths", "strengths"),
+    ("## 🎯 Areas for Improvement", "areas_for_improvement"),
+    ("## 💡 Actionable Advice", "actionable_advice"),
+)
+
+# Defaults for report fields rendered through str.format_map
+_REPORT_FIELD_DEFAULTS = {
+    "session_id": "N/A",
+    "timestamp": "N/A",
+    "duration_minutes": 0,
+    "questions_answered": 0,
+    "overall_score": 0,
+    "overall_score_normalized": 0,
+}
+_SCORE_FIELD_DEFAULTS = {"mean": 0, "median": 0, "min": 0, "max": 0, "count": 0}
+
+# Plain-text blocks laid out as Preformatted, so they bypass the markup parser
+_PDF_SESSION_DETAILS_TEMPLATE = (
+    "• Session ID: {session_id}\n"
+    "• Timestamp: {timestamp}\n"
+    "• Duration: {duration_minutes:.1f} minutes\n"
+    "• Questions Answered: {questions_answered}\n"
+    "• Overall Score (Raw): {overall_score:.3f}/5.0\n"
+    "• Overall Score (Normalized): {overall_score_normalized:.1f}/100"
+)
+_MD_SCORE_BREAKDOWN_TEMPLATE = (
+    "**{dimension}:**\n"
+    "  • Mean: {mean:.3f}\n"
+    "  • Median: {median:.3f}\n"
+    "  • Min: {min:.3f}\n"
+    "  • Max: {max:.3f}\n"
+    "  • Count: {count}"
+)
+_PDF_SCORE_BREAKDOWN_TEMPLATE = (
+    "{dimension}:\n"
+    "  Mean: {mean:.3f}, Median: {median:.3f}\n"
+    "  Min: {min:.3f}, Max: {max:.3f}, Count: {count}"
+)
+
+
+@lru_cache(maxsize=None)
+def _primary_milestones(dimension: str) -> Tuple[str, ...]:
+    return (
+        f"Month 1: Focus on {dimension} fundamentals",
+        f"Month 2: Practice {dimension} with real-world scenarios",
+        f"Month 3: Integrate {dimension} improvements with other skills",
+    )
+
+
+@lru_cache(maxsize=None)
+def _secondary_milestones(dimension: str) -> Tuple[str, ...]:
+    return (
+        f"Month 4-5: Address {dimension} development",
+        "Month 6: Comprehensive practice integrating all skills",
+    )
+
+
+_SKILL_LEVEL_THRESHOLDS = (2.0, 3.0, 4.0, 4.5)
+_SKILL_LEVELS = ("Beginner", "Developing", "Intermediate", "Advanced", "Expert")
+
+_STRENGTH_TEMPLATES = {
+    "correctness": "Demonstrates strong technical accuracy (score: {score:.1f}/5)",
+    "design": "Shows excellent system design thinking (score: {score:.1f}/5)",
+    "communication": "Communicates clearly and effectively (score: {score:.1f}/5)",
+    "production": "Understands production-ready considerations (score: {score:.1f}/5)",
+}
+
+_WEAKNESS_TEMPLATES = {
+    "correctness": "Technical accuracy needs improvement (score: {score:.1f}/5)",
+    "design": "System design thinking could be stronger (score: {score:.1f}/5)",
+    "communication": "Communication clarity needs work (score: {score:.1f}/5)",
+    "production": "Production considerations need more attention (score: {score:.1f}/5)",
+}
+
+_IMPROVEMENT_SUGGESTIONS = {
+    "correctness": "Review fundamental concepts and practice technical accuracy",
+    "design": "Study system design patterns and practice architectural thinking",
+    "communication": "Practice explaining technical concepts with clear examples",
+    "production": "Learn about scalability, monitoring, and production best practices",
+}
+
+_SPECIFIC_FEEDBACK_TEMPLATES = {
+    "correctness": {
+        "high": "Your technical solutions demonstrate strong accuracy and understanding of Excel fundamentals. You consistently provide correct formulas and approaches.",
+        "medium": "You show good grasp of Excel concepts but occasionally miss nuances in complex scenarios. Focus on edge cases and formula optimization.",
+        "low": "There are opportunities to strengthen your Excel technical foundation. Review basic functions, formula syntax, and common Excel operations.",
+    },
+    "design": {
+        "high": "Excellent approach to structuring Excel solutions. You think systematically about data organization and workflow efficiency.",
+        "medium": "Good design thinking with room for improvement in considering scalability and maintainability of Excel solutions.",
+        "low": "Focus on developing systematic approaches to Excel problem-solving. Consider data structure, user experience, and solution maintainability.",
+    },
+    "communication": {
+        "high": "You explain Excel concepts clearly and provide helpful context for your solutions. Your communication enhances understanding.",
+        "medium": "Generally clear communication with opportunities to be more specific about Excel terminology and step-by-step processes.",
+        "low": "Work on explaining Excel solutions more clearly. Use specific terminology and break down complex processes into steps.",
+    },
+    "production": {
+        "high": "Strong awareness of real-world Excel implementation challenges. You consider error handling, user experience, and maintainability.",
+        "medium": "Good understanding of practical Excel considerations with room to think more about scalability and robustness.",
+        "low": "Develop awareness of how Excel solutions work in practice. Consider error handling, data validation, and user-friendly design.",
+    },
+}
+
+_IMPROVEMENT_STRATEGIES = {
+    "correctness": [
+        "Practice Excel functions daily with increasingly complex scenarios",
+        "Review Excel documentation for advanced function usage",
+        "Test formulas with edge cases and unusual data",
+        "Use Excel's formula auditing tools to understand formula logic",
+    ],
+    "design": [
+        "Study well-designed Excel templates and analyze their structure",
+        "Practice organizing data with proper headers, formatting, and layout",
+        "Learn about Excel table features and named ranges for better organization",
+        "Consider user workflow when designing Excel solutions",
+    ],
+    "communication": [
+        "Practice explaining Excel solutions to non-technical users",
+        "Use comments and documentation within Excel files",
+        "Create step-by-step guides for complex Excel processes",
+        "Learn Excel terminology to communicate more precisely",
+    ],
+    "production": [
+        "Learn about Excel security features and data protection",
+        "Practice error handling with IFERROR and data validation",
+        "Study Excel performance optimization techniques",
+        "Consider version control and collaboration features in Excel",
+    ],
+}
+
+_LEARNING_RESOURCES = {
+    "correctness": [
+        "Microsoft Excel Help & Training (official documentation)",
+        "ExcelJet - Excel formulas and functions reference",
+        "Excel University courses for structured learning",
+    ],
+    "design": [
+        "Excel Dashboard School for design principles",
+        "Microsoft Excel templates gallery for inspiration",
+        "Excel Campus courses on professional Excel design",
+    ],
+    "communication": [
+        "Excel documentation best practices guides",
+        "Technical writing courses for clear explanations",
+        "Excel user community forums for communication practice",
+    ],
+    "production": [
+        "Microsoft Excel security and compliance documentation",
+        "Excel VBA resources for automation and robustness",
+        "Business analysis courses focusing on Excel implementations",
+    ],
+}
+
+
+@lru_cache(maxsize=64)
+def _title(text: str) -> str:
+    return text.title()
+
+
+def _iter_score_fields(scores: Dict[str, Dict[str, Any]]) -> Iterator[ChainMap]:
+    """Yield format_map contexts for each scored dimension, in report order"""
+    for dimension in _REPORT_SCORE_DIMENSIONS:
+        score_data = scores.get(dimension)
+        if score_data is not None:
+            yield ChainMap(
+                {"dimension": _title(dimension)}, score_data, _SCORE_FIELD_DEFAULTS
+            )
+
+
+def _truncate_text(text: str, length: int) -> str:
+    return text if len(text) <= length else text[:length] + "..."
+
+
+_JINJA_ENV = Environment(
+    loader=BaseLoader(), trim_blocks=True, lstrip_blocks=True, auto_reload=False
+)
+_JINJA_ENV.filters["fmt"] = format
+_JINJA_ENV.filters["truncate_text"] = _truncate_text
+_JINJA_ENV.filters["title_case"] = _title
+_JINJA_ENV.filters["score_fields"] = _iter_score_fields
+
+# Compiled once at import; rendering is a single pass with no intermediate lists.
+_CONSTRUCTIVE_REPORT_TEMPLATE = _JINJA_ENV.from_string(
+    """\
+# 📊 Excel Skills Interview - Constructive Feedback Report
+
+**Session ID:** {{ report.get("session_id", "N/A") }}
+**Date:** {{ (report.get("timestamp", "") | string)[:19] }}
+**Duration:** {{ report.get("duration_minutes", 0) | fmt(".1f") }} minutes
+**Questions Answered:** {{ report.get("questions_answered", 0) }}
+{% if report.get("generation_method") == "fallback_rule_based" %}
+*Note: Generated using fallback method due to AI service unavailability*
+{% endif %}
+
+## 🎯 Overall Performance: {{ report.get("overall_score_normalized", 0) | fmt(".0f") }}/100
+*Raw Score: {{ report.get("overall_score", 0) | fmt(".2f") }}/5.0*
+
+{% set enhanced_feedback = report.get("enhanced_feedback", {}) %}
+{% if enhanced_feedback %}
+## 📈 Detailed Skill Analysis
+
+{% for dimension, feedback in enhanced_feedback.items() %}
+### {{ dimension | title_case }}
+**Current Level:** {{ feedback.get("current_level", "N/A") }}
+**Analysis:** {{ feedback.get("specific_feedback", "No feedback available") }}
+
+{% set strategies = feedback.get("improvement_strategies", []) %}
+{% if strategies %}
+**Improvement Strategies:**
+{% for strategy in strategies %}
+• {{ strategy }}
+{% endfor %}
+
+{% endif %}
+{% set resources = feedback.get("resources", []) %}
+{% if resources %}
+**Learning Resources:**
+{% for resource in resources %}
+• {{ resource }}
+{% endfor %}
+
+{% endif %}
+{% endfor %}
+{% endif %}
+{% set learning_path = report.get("learning_path", {}) %}
+{% if learning_path %}
+## 🛤️ Personalized Learning Path
+
+**Priority Focus:** {{ learning_path.get("priority_focus", "N/A") | title_case }}
+{% if learning_path.get("secondary_focus") %}
+**Secondary Focus:** {{ learning_path.get("secondary_focus") | title_case }}
+{% endif %}
+**Recommended Timeline:** {{ learning_path.get("timeline", "N/A") }}
+
+{% set milestones = learning_path.get("milestones", []) %}
+{% if milestones %}
+**Learning Milestones:**
+{% for milestone in milestones %}
+• {{ milestone }}
+{% endfor %}
+
+{% endif %}
+{% endif %}
+{% set next_steps = report.get("next_steps", []) %}
+{% if next_steps %}
+## 🚀 Immediate Next Steps
+
+{% for step in next_steps %}
+{{ loop.index }}. {{ step }}
+{% endfor %}
+
+{% endif %}
+{% set performance_trends = report.get("performance_trends", {}) %}
+{% if performance_trends and performance_trends.get("trend") != "insufficient_data" %}
+## 📊 Performance Trends
+
+**Trend:** {{ performance_trends.get("description", "No trend analysis available") }}
+
+{% endif %}
+{% set detailed_responses = report.get("detailed_responses", []) %}
+{% if detailed_responses %}
+## 📝 Question-by-Question Feedback
+
+{% for response in detailed_responses %}
+### Question {{ response.get("question_number", "?") }} (Score: {{ response.get("scores", {}).get("overall", 0) | fmt(".1f") }}/5.0)
+**Question:** {{ response.get("question", "N/A") | truncate_text(150) }}
+**Your Response:** {{ response.get("answer_preview", "No answer") }}
+
+{% set rationale = response.get("rationale", "") %}
+{% if rationale and rationale != "No evaluation rationale provided" %}
+**Detailed Feedback:** {{ rationale }}
+
+{% endif %}
+{% endfor %}
+{% endif %}
+---
+
+## 📊 Raw Statistics
+
+### Session Details
+• **Session ID:** {{ report.get("session_id", "N/A") }}
+• **Timestamp:** {{ report.get("timestamp", "N/A") }}
+• **Duration:** {{ report.get("duration_minutes", 0) | fmt(".1f") }} minutes
+• **Questions Answered:** {{ report.get("questions_answered", 0) }}
+• **Overall Score (Raw):** {{ report.get("overall_score", 0) | fmt(".3f") }}/5.0
+• **Overall Score (Normalized):** {{ report.get("overall_score_normalized", 0) | fmt(".1f") }}/100
+
+{% set scores = report.get("scores", {}) %}
+{% if scores %}
+### Score Breakdown by Dimension
+
+{% for score_fields in scores | score_fields %}
+{{ score_breakdown_template.format_map(score_fields) }}
+
+{% endfor %}
+{% endif %}
+{% set strengths = report.get("strengths", []) %}
+{% if strengths %}
+### Identified Strengths
+
+{% for strength in strengths %}
+• {{ strength }}
+{% endfor %}
+
+{% endif %}
+{% set areas_for_improvement = report.get("areas_for_improvement", []) %}
+{% if areas_for_improvement %}
+### Areas for Improvement
+
+{% for area in areas_for_improvement %}
+• {{ area }}
+{% endfor %}
+
+{% endif %}
+{% set meta = report.get("meta", {}) %}
+{% if meta %}
+### Technical Metadata
+
+{% for key, value in meta.items() %}
+• **{{ key }}:** {{ value }}
+{% endfor %}
+
+{% endif %}
+---
+
+## 💡 Remember
+• Excel mastery comes with consistent practice
+• Focus on real-world applications to reinforce learning
+• Don't hesitate to explore Excel's extensive help documentation
+• Consider joining Excel communities for ongoing support
+
+*This report is designed to help you grow. Focus on progress, not perfection!*
+"""
+)
+
+# Sections of the constructive report that are omitted when empty. A report with
+# none of them (e.g. the stub left by a failed report) skips the full template.
+_CONSTRUCTIVE_REPORT_SECTIONS = (
+    "enhanced_feedback",
+    "learning_path",
+    "next_steps",
+    "detailed_responses",
+    "scores",
+    "strengths",
+    "areas_for_improvement",
+    "meta",
+)
+
+_EMPTY_CONSTRUCTIVE_REPORT_TEMPLATE = """\
+# 📊 Excel Skills Interview - Constructive Feedback Report
+
+**Session ID:** {session_id}
+**Date:** {date}
+**Duration:** {duration_minutes:.1f} minutes
+**Questions Answered:** {questions_answered}
+
+## 🎯 Overall Performance: {overall_score_normalized:.0f}/100
+*Raw Score: {overall_score:.2f}/5.0*
+
+---
+
+## 📊 Raw Statistics
+
+### Session Details
+• **Session ID:** {session_id}
+• **Timestamp:** {timestamp}
+• **Duration:** {duration_minutes:.1f} minutes
+• **Questions Answered:** {questions_answered}
+• **Overall Score (Raw):** {overall_score:.3f}/5.0
+• **Overall Score (Normalized):** {overall_score_normalized:.1f}/100
+
+---
+
+## 💡 Remember
+• Excel mastery comes with consistent practice
+• Focus on real-world applications to reinforce learning
+• Don't hesitate to explore Excel's extensive help documentation
+• Consider joining Excel communities for ongoing support
+
+*This report is designed to help you grow. Focus on progress, not perfection!*"""
+
+
+@dataclass(slots=True)
+class _ReportAccumulator:
+    session_id: str
+    timestamp: datetime.datetime
+    duration_minutes: float
+    questions_answered: int
+    scores: Dict[str, Dict[str, float]]
+    overall_score: float
+    overall_score_normalized: float
+    strengths: List[str]
+    areas_for_improvement: List[str]
+    actionable_advice: List[str]
+    detailed_responses: List[Dict[str, Any]]
+    meta: Dict[str, str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view in field order; nested values are shared, not copied"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Reporter:
+    def __init__(
+        self,
+        model_name: str = "gemini-2.5-flash",
+        temperature: float = 0.0,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.semantic_cache = semantic_cache
+        self.score_dimensions = ["correctness", "design", "communication", "production"]
+        self.weights = {
+            "correctness": 0.4,
+            "design": 0.3,
+            "communication": 0.2,
+            "production": 0.1,
+        }
+
+        self.parser = _PARSER
+        self.report_chain = _build_report_chain(model_name, temperature)
+        self.cache_stats = {"hits": 0, "misses": 0}
+
     def generate_report(self, state: InterviewState) -> Dict[str, Any]:
+        now = datetime.datetime.now(_UTC)
+
         if not state.responses:
             return {
                 "message": "No responses to evaluate",
                 "session_id": state.session_id,
-                "timestamp": datetime.datetime.now(
-                    tz=datetime.timezone.utc
-                ).isoformat(),
+                "timestamp": now.isoformat(),
             }
 
-        scores_summary = self._calculate_scores_summary(state.responses)
+        score_matrix, detailed_responses = self._aggregate_responses(state.responses)
+        scores_summary = self._calculate_scores_summary(score_matrix)
         strengths_weaknesses = self._identify_strengths_weaknesses(scores_summary)
-        advice = self._generate_advice(state.responses)
-
-        report = {
-            "session_id": state.session_id,
-            "timestamp": datetime.datetime.now(tz=datetime.timezone.utc),
-            "duration_minutes": self._calculate_duration(state),
-            "questions_answered": len(state.responses),
-            "scores": scores_summary,
-            "overall_score": scores_summary.get("overall", {}).get("mean", 0),
-            "overall_score_normalized": min(
-                100, max(0, scores_summary.get("overall", {}).get("mean", 0) * 20)
-            ),
-            "strengths": strengths_weaknesses["strengths"],
-            "areas_for_improvement": strengths_weaknesses["weaknesses"],
-            "actionable_advice": advice,
-            "detailed_responses": self._format_detailed_responses(state.responses),
-            "meta": state.meta,
-        }
+        advice = self._generate_advice(score_matrix)
+
+        overall_mean = scores_summary["overall"]["mean"]
+        normalized = overall_mean * 20.0
+
+        report = _ReportAccumulator(
+            session_id=state.session_id,
+            timestamp=now,
+            duration_minutes=self._calculate_duration(state),
+            questions_answered=len(state.responses),
+            scores=scores_summary,
+            overall_score=overall_mean,
+            overall_score_normalized=max(0.0, min(100.0, normalized)),
+            strengths=strengths_weaknesses["strengths"],
+            areas_for_improvement=strengths_weaknesses["weaknesses"],
+            actionable_advice=advice,
+            detailed_responses=detailed_responses,
+            meta=state.meta,
+        )
 
-        return report
+        return report.to_dict()
 
-    def _calculate_scores_summary(
+    def _aggregate_responses(
         self, responses: List[ResponseRecord]
-    ) -> Dict[str, Dict[str, float]]:
-        scores_by_dimension = {dim: [] for dim in self.score_dimensions + ["overall"]}
+    ) -> Tuple[np.ndarray, List[Dict[str, Any]]]:
+        """Collect the score matrix and response details in one pass"""
+        dimensions = self.score_dimensions + ["overall"]
+
+        score_matrix = np.full((len(responses), len(dimensions)), np.nan)
+        detailed_responses = []
 
-        for response in responses:
+        for row, response in enumerate(responses):
             if response.scores:
-                for dim in self.score_dimensions + ["overall"]:
+                for col, dim in enumerate(dimensions):
                     if dim in response.scores:
-                        scores_by_dimension[dim].append(response.scores[dim])
+                        score_matrix[row, col] = response.scores[dim]
+
+            detailed_responses.append(self._format_detailed_response(row + 1, response))
+
+        return score_matrix, detailed_responses
+
+    def _calculate_scores_summary(
+        self, score_matrix: np.ndarray
+    ) -> Dict[str, Dict[str, float]]:
+        dimensions = self.score_dimensions + ["overall"]
+
+        counts = np.count_nonzero(~np.isnan(score_matrix), axis=0)
+        scored = score_matrix[:, counts > 0]
+        column_stats = iter(())
+        if scored.size:
+            column_stats = zip(
+                np.nanmean(scored, axis=0),
+                np.nanmedian(scored, axis=0),
+                np.nanmin(scored, axis=0),
+                np.nanmax(scored, axis=0),
+            )
 
         summary = {}
-        for dim, scores in scores_by_dimension.items():
-            if scores:
+        for dim, n_scored in zip(dimensions, counts):
+            if n_scored:
+                mean, median, low, high = next(column_stats)
                 summary[dim] = {
-                    "mean": statistics.mean(scores),
-                    "median": statistics.median(scores),
-                    "min": min(scores),
-                    "max": max(scores),
-                    "count": len(scores),
+                    "mean": float(mean),
+                    "median": float(median),
+                    "min": float(low),
+                    "max": float(high),
+                    "count": int(n_scored),
                 }
             else:
                 summary[dim] = {
@@ -264,43 +829,31 @@ class Reporter:
         return {"strengths": strengths, "weaknesses": weaknesses}
 
     def _dimension_to_strength(self, dimension: str, score: float) -> str:
-        templates = {
-            "correctness": f"Demonstrates strong technical accuracy (score: {score:.1f}/5)",
-            "design": f"Shows excellent system design thinking (score: {score:.1f}/5)",
-            "communication": f"Communicates clearly and effectively (score: {score:.1f}/5)",
-            "production": f"Understands production-ready considerations (score: {score:.1f}/5)",
-        }
-        return templates.get(
-            dimension, f"Strong {dimension} skills (score: {score:.1f}/5)"
-        )
+        template = _STRENGTH_TEMPLATES.get(dimension)
+        if template is None:
+            return f"Strong {dimension} skills (score: {score:.1f}/5)"
+        return template.format(score=score)
 
     def _dimension_to_weakness(self, dimension: str, score: float) -> str:
-        templates = {
-            "correctness": f"Technical accuracy needs improvement (score: {score:.1f}/5)",
-            "design": f"System design thinking could be stronger (score: {score:.1f}/5)",
-            "communication": f"Communication clarity needs work (score: {score:.1f}/5)",
-            "production": f"Production considerations need more attention (score: {score:.1f}/5)",
-        }
-        return templates.get(
-            dimension, f"{dimension.title()} needs improvement (score: {score:.1f}/5)"
+        template = _WEAKNESS_TEMPLATES.get(dimension)
+        if template is None:
+            return f"{_title(dimension)} needs improvement (score: {score:.1f}/5)"
+        return template.format(score=score)
+
+    def _generate_advice(self, score_matrix: np.ndarray) -> List[str]:
+        # NaN compares False, so unscored entries never count as weak. Weak
+        # dimensions are ordered by the first response that scored them low;
+        # the sort is stable over ascending columns, which breaks ties.
+        low_mask = score_matrix[:, : len(self.score_dimensions)] < 3.0
+        first_low_row = low_mask.argmax(axis=0)
+        low_dimensions = sorted(
+            np.flatnonzero(low_mask.any(axis=0)), key=first_low_row.__getitem__
         )
 
-    def _generate_advice(self, responses: List[ResponseRecord]) -> List[str]:
-        advice = []
-        advice_seen = set()
-
-        for response in responses:
-            if hasattr(response, "rationale") and response.rationale:
-                continue
-
-        for response in responses:
-            if response.scores:
-                for dim in self.score_dimensions:
-                    if dim in response.scores and response.scores[dim] < 3.0:
-                        suggestion = self._get_improvement_suggestion(dim)
-                        if suggestion not in advice_seen:
-                            advice.append(suggestion)
-                            advice_seen.add(suggestion)
+        advice = [
+            self._get_improvement_suggestion(self.score_dimensions[col])
+            for col in low_dimensions
+        ]
 
         if not advice:
             advice.append(
@@ -310,35 +863,23 @@ class Reporter:
         return advice[:5]
 
     def _get_improvement_suggestion(self, dimension: str) -> str:
-        suggestions = {
-            "correctness": "Review fundamental concepts and practice technical accuracy",
-            "design": "Study system design patterns and practice architectural thinking",
-            "communication": "Practice explaining technical concepts with clear examples",
-            "production": "Learn about scalability, monitoring, and production best practices",
-        }
-        return suggestions.get(dimension, f"Focus on improving {dimension} skills")
-
-    def _format_detailed_responses(
-        self, responses: List[ResponseRecord]
-    ) -> List[Dict[str, Any]]:
-        detailed = []
-
-        for i, response in enumerate(responses, 1):
-            detail = {
-                "question_number": i,
-                "question": response.question_text,
-                "answer_preview": response.answer_text[:200] + "..."
-                if len(response.answer_text) > 200
-                else response.answer_text,
-                "scores": response.scores or {},
-                "rationale": response.rationale or "No evaluation rationale provided",
-                "timestamp": response.timestamp.isoformat()
-                if response.timestamp
-                else None,
-            }
-            detailed.append(detail)
+        return _IMPROVEMENT_SUGGESTIONS.get(
+            dimension, f"Focus on improving {dimension} skills"
+        )
 
-        return detailed
+    def _format_detailed_response(
+        self, question_number: int, response: ResponseRecord
+    ) -> Dict[str, Any]:
+        return {
+            "question_number": question_number,
+            "question": response.question_text,
+            "answer_preview": _truncate_text(response.answer_text, 200),
+            "scores": response.scores or {},
+            "rationale": response.rationale or "No evaluation rationale provided",
+            "timestamp": response.timestamp.isoformat()
+            if response.timestamp
+            else None,
+        }
 
     def _calculate_duration(self, state: InterviewState) -> float:
         if state.end_time and state.start_time:
@@ -348,76 +889,62 @@ class Reporter:
 
     def format_text_report(self, report: Dict[str, Any]) -> str:
         """Generate a clean, readable report from the JSON data"""
-
-        lines = [
-            "# 📊 Excel Skills Interview Report",
-            "",
-            f"**Session ID:** {report.get('session_id', 'N/A')}",
-            f"**Date:** {str(report.get('timestamp', ''))[:19]}",
-            f"**Duration:** {report.get('duration_minutes', 0):.1f} minutes",
-            f"**Questions Answered:** {report.get('questions_answered', 0)}",
-            "",
-            f"## 🎯 Overall Score: {report.get('overall_score_normalized', 0):.0f}/100",
-            f"*Raw Score: {report.get('overall_score', 0):.2f}/5.0*",
-            "",
-        ]
+        out = io.StringIO()
+        write = out.write
+
+        write(
+            "# 📊 Excel Skills Interview Report\n\n"
+            f"**Session ID:** {report.get('session_id', 'N/A')}\n"
+            f"**Date:** {str(report.get('timestamp', ''))[:19]}\n"
+            f"**Duration:** {report.get('duration_minutes', 0):.1f} minutes\n"
+            f"**Questions Answered:** {report.get('questions_answered', 0)}\n\n"
+            f"## 🎯 Overall Score: {report.get('overall_score_normalized', 0):.0f}/100\n"
+            f"*Raw Score: {report.get('overall_score', 0):.2f}/5.0*\n\n"
+        )
 
         scores = report.get("scores", {})
         if scores:
-            lines.extend(["## 📊 Score Breakdown", ""])
-
-            for dimension in ["correctness", "design", "communication", "production"]:
-                if dimension in scores:
-                    score_data = scores[dimension]
+            write("## 📊 Score Breakdown\n\n")
+            for dimension in _SKILL_DIMENSIONS:
+                score_data = scores.get(dimension)
+                if score_data is not None:
                     mean_score = score_data.get("mean", 0)
-                    lines.append(f"**{dimension.title()}:** {mean_score:.1f}/5.0")
-            lines.append("")
+                    write(f"**{_title(dimension)}:** {mean_score:.1f}/5.0\n")
+            write("\n")
 
-        strengths = report.get("strengths", [])
-        if strengths:
-            lines.extend(["## ✅ Strengths", ""])
-            for strength in strengths:
-                lines.append(f"• {strength}")
-            lines.append("")
-
-        areas_for_improvement = report.get("areas_for_improvement", [])
-        if areas_for_improvement:
-            lines.extend(["## 🎯 Areas for Improvement", ""])
-            for area in areas_for_improvement:
-                lines.append(f"• {area}")
-            lines.append("")
-
-        advice = report.get("actionable_advice", [])
-        if advice:
-            lines.extend(["## 💡 Actionable Advice", ""])
-            for item in advice:
-                lines.append(f"• {item}")
-            lines.append("")
+        for heading, key in _TEXT_REPORT_LIST_SECTIONS:
+            items = report.get(key, [])
+            if items:
+                write(f"{heading}\n\n")
+                write("".join(f"• {item}\n" for item in items))
+                write("\n")
 
         detailed_responses = report.get("detailed_responses", [])
         if detailed_responses:
-            lines.extend(["## 📝 Question Summary", ""])
+            write("## 📝 Question Summary\n\n")
 
             for response in detailed_responses:
                 q_num = response.get("question_number", "?")
                 overall_score = response.get("scores", {}).get("overall", 0)
-                lines.append(f"**Question {q_num}** (Score: {overall_score:.1f}/5.0)")
-                lines.append(f"*Answer:* {response.get('answer_preview', 'No answer')}")
+                write(
+                    f"**Question {q_num}** (Score: {overall_score:.1f}/5.0)\n"
+                    f"*Answer:* {response.get('answer_preview', 'No answer')}\n"
+                )
 
                 rationale = response.get("rationale", "")
                 if rationale and rationale != "No evaluation rationale provided":
-                    lines.append(f"*Feedback:* {rationale}")
-                lines.append("")
+                    write(f"*Feedback:* {rationale}\n")
+                write("\n")
 
-        lines.extend(["---", "", "*For detailed analysis, view the raw JSON report.*"])
+        write("---\n\n*For detailed analysis, view the raw JSON report.*")
 
-        return "\n".join(lines)
+        return out.getvalue()
 
     def get_json_report(self, report: Dict[str, Any]) -> str:
         """Return the raw JSON report as a formatted string"""
-        import json
-
-        return json.dumps(report, indent=2, default=str)
+        return orjson.dumps(
+            report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
 
     def generate_constructive_feedback_report(
         self, state: InterviewState
@@ -440,35 +967,46 @@ class Reporter:
             logger.error(f"Agent-based report generation failed: {e}")
             return self._generate_fallback_constructive_report(state, base_report)
 
+    async def agenerate_constructive_feedback_report(
+        self, state: InterviewState
+    ) -> Dict[str, Any]:
+        """Async variant of generate_constructive_feedback_report"""
+        base_report = self.generate_report(state)
+
+        if not state.responses:
+            return base_report
+
+        try:
+            agent_feedback = await self._agenerate_agent_based_feedback(
+                state, base_report
+            )
+
+            base_report.update(agent_feedback)
+            base_report["report_type"] = "constructive_feedback"
+
+            return base_report
+
+        except Exception as e:
+            logger.error(f"Agent-based report generation failed: {e}")
+            return self._generate_fallback_constructive_report(state, base_report)
+
     def _generate_agent_based_feedback(
         self, state: InterviewState, base_report: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Use LLM agent to generate constructive feedback"""
         try:
-            detailed_responses_text = self._format_responses_for_prompt(state.responses)
-
-            scores_summary = base_report.get("scores", {})
+            cache_key = self._report_cache_key(state)
+            cached = self._get_cached_feedback(cache_key)
+            if cached is None:
+                cached = self._lookup_similar_feedback(state, base_report)
+            if cached is not None:
+                return cached
 
-            prompt_data = {
-                "session_id": state.session_id,
-                "duration_minutes": base_report.get("duration_minutes", 0),
-                "questions_answered": len(state.responses),
-                "overall_score": base_report.get("overall_score", 0),
-                "overall_score_normalized": base_report.get(
-                    "overall_score_normalized", 0
-                ),
-                "correctness_score": scores_summary.get("correctness", {}).get(
-                    "mean", 0
-                ),
-                "design_score": scores_summary.get("design", {}).get("mean", 0),
-                "communication_score": scores_summary.get("communication", {}).get(
-                    "mean", 0
-                ),
-                "production_score": scores_summary.get("production", {}).get("mean", 0),
-                "detailed_responses": detailed_responses_text,
-            }
+            prompt_data = self._build_report_prompt_data(state, base_report)
 
             agent_result = self.report_chain.invoke(prompt_data)
+            self._store_cached_feedback(cache_key, agent_result)
+            self._store_similar_feedback(state, base_report, agent_result)
 
             return agent_result
 
@@ -476,28 +1014,147 @@ class Reporter:
             logger.error(f"LLM report generation failed: {e}")
             raise
 
-    def _format_responses_for_prompt(self, responses: List[ResponseRecord]) -> str:
-        """Format interview responses for the LLM prompt"""
-        formatted_responses = []
+    async def _agenerate_agent_based_feedback(
+        self, state: InterviewState, base_report: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Async variant of _generate_agent_based_feedback"""
+        try:
+            cache_key = self._report_cache_key(state)
+            cached = self._get_cached_feedback(cache_key)
+            if cached is None:
+                # Embeds the answers over the network, so keep it off the loop
+                cached = await asyncio.to_thread(
+                    self._lookup_similar_feedback, state, base_report
+                )
+            if cached is not None:
+                return cached
 
-        for i, response in enumerate(responses, 1):
-            response_text = f"""
-            <response_{i}>
-            <question>{response.question_text}</question>
-            <answer>{response.answer_text}</answer>
-            <scores>
-                Correctness: {response.scores.get("correctness", 0):.1f}/5.0
-                Design: {response.scores.get("design", 0):.1f}/5.0
-                Communication: {response.scores.get("communication", 0):.1f}/5.0
-                Production: {response.scores.get("production", 0):.1f}/5.0
-                Overall: {response.scores.get("overall", 0):.1f}/5.0
-            </scores>
-            <evaluator_feedback>{response.rationale}</evaluator_feedback>
-            </response_{i}>
-            """
-            formatted_responses.append(response_text.strip())
+            prompt_data = self._build_report_prompt_data(state, base_report)
+
+            agent_result = await self.report_chain.ainvoke(prompt_data)
+            self._store_cached_feedback(cache_key, agent_result)
+            await asyncio.to_thread(
+                self._store_similar_feedback, state, base_report, agent_result
+            )
+
+            return agent_result
+
+        except Exception as e:
+            logger.error(f"LLM report generation failed: {e}")
+            raise
+
+    def _report_cache_key(self, state: InterviewState) -> str:
+        """Hash the model settings and interview content that drive the LLM report"""
+        payload = orjson.dumps(
+            {
+                "model": self.model_name,
+                "temperature": self.temperature,
+                "session_id": state.session_id,
+                "responses": [
+                    (r.question_text, r.answer_text, r.scores) for r in state.responses
+                ],
+            },
+            default=str,
+            option=_HASH_DUMPS_OPTIONS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _get_cached_feedback(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        with _REPORT_CACHE_LOCK:
+            cached = _REPORT_CACHE.get(cache_key)
+
+        if cached is None:
+            self.cache_stats["misses"] += 1
+            return None
+
+        self.cache_stats["hits"] += 1
+        return copy.deepcopy(cached)
+
+    def _store_cached_feedback(self, cache_key: str, feedback: Dict[str, Any]):
+        with _REPORT_CACHE_LOCK:
+            _REPORT_CACHE[cache_key] = copy.deepcopy(feedback)
+
+    def _semantic_cache_entry(
+        self, state: InterviewState, base_report: Dict[str, Any]
+    ) -> Tuple[str, Tuple[int, int], str]:
+        """Answers, score bucket and question chain under which feedback is cached"""
+        text = "\n\n".join(r.answer_text for r in state.responses)
+        bucket = (len(state.responses), round(base_report.get("overall_score", 0)))
+        # Similar answers only share feedback when given to similar questions
+        context = "\n\n".join(r.question_text for r in state.responses)
+        return text, bucket, context
+
+    def _lookup_similar_feedback(
+        self, state: InterviewState, base_report: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        if self.semantic_cache is None:
+            return None
+
+        try:
+            text, bucket, context = self._semantic_cache_entry(state, base_report)
+            return self.semantic_cache.lookup(text, bucket, context)
+        except Exception as e:
+            logger.warning(f"Semantic report cache lookup failed: {e}")
+            return None
+
+    def _store_similar_feedback(
+        self,
+        state: InterviewState,
+        base_report: Dict[str, Any],
+        feedback: Dict[str, Any],
+    ):
+        if self.semantic_cache is None:
+            return
+
+        try:
+            text, bucket, context = self._semantic_cache_entry(state, base_report)
+            self.semantic_cache.store(text, feedback, bucket, context)
+        except Exception as e:
+            logger.warning(f"Semantic report cache store failed: {e}")
+
+    def _build_report_prompt_data(
+        self, state: InterviewState, base_report: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the template variables for the report generation prompt"""
+        detailed_responses_text = self._format_responses_for_prompt(state.responses)
+
+        scores_summary = base_report.get("scores", {})
+
+        return {
+            "session_id": state.session_id,
+            "duration_minutes": base_report.get("duration_minutes", 0),
+            "questions_answered": len(state.responses),
+            "overall_score": base_report.get("overall_score", 0),
+            "overall_score_normalized": base_report.get(
+                "overall_score_normalized", 0
+            ),
+            "correctness_score": scores_summary.get("correctness", {}).get(
+                "mean", 0
+            ),
+            "design_score": scores_summary.get("design", {}).get("mean", 0),
+            "communication_score": scores_summary.get("communication", {}).get(
+                "mean", 0
+            ),
+            "production_score": scores_summary.get("production", {}).get("mean", 0),
+            "detailed_responses": detailed_responses_text,
+        }
 
-        return "\n\n".join(formatted_responses)
+    def _format_responses_for_prompt(self, responses: List[ResponseRecord]) -> str:
+        """Format interview responses for the LLM prompt"""
+        return "\n\n".join(
+            _format_response_for_prompt(
+                i,
+                response.question_text,
+                response.answer_text,
+                response.scores.get("correctness", 0),
+                response.scores.get("design", 0),
+                response.scores.get("communication", 0),
+                response.scores.get("production", 0),
+                response.scores.get("overall", 0),
+                response.rationale,
+            )
+            for i, response in enumerate(responses, 1)
+        )
 
     def _generate_fallback_constructive_report(
         self, state: InterviewState, base_report: Dict[str, Any]
@@ -505,8 +1162,12 @@ class Reporter:
         """Fallback to rule-based report generation if LLM fails"""
         logger.info("Using fallback rule-based report generation")
 
-        enhanced_feedback = self._generate_enhanced_feedback(state.responses)
-        learning_path = self._generate_learning_path(state.responses)
+        # Per-dimension means/counts were already reduced from the score matrix
+        scores_summary = base_report.get("scores", {})
+        enhanced_feedback = self._generate_enhanced_feedback(
+            state.responses, scores_summary
+        )
+        learning_path = self._generate_learning_path(scores_summary)
         performance_trends = self._analyze_performance_trends(state.responses)
         next_steps = self._generate_next_steps(
             state.responses, base_report.get("overall_score", 0)
@@ -526,76 +1187,56 @@ class Reporter:
         return base_report
 
     def _generate_enhanced_feedback(
-        self, responses: List[ResponseRecord]
+        self,
+        responses: List[ResponseRecord],
+        scores_summary: Dict[str, Dict[str, float]],
     ) -> Dict[str, Any]:
         """Generate detailed constructive feedback for each dimension"""
-        feedback = {}
+        results = _FEEDBACK_EXECUTOR.map(
+            lambda dimension: self._build_dimension_feedback(
+                dimension, scores_summary.get(dimension, {}), responses
+            ),
+            self.score_dimensions,
+        )
 
-        for dimension in self.score_dimensions:
-            scores = [
-                r.scores.get(dimension, 0)
-                for r in responses
-                if r.scores and dimension in r.scores
-            ]
-            if not scores:
-                continue
-
-            avg_score = statistics.mean(scores)
-            feedback[dimension] = {
-                "current_level": self._get_skill_level(avg_score),
-                "specific_feedback": self._get_specific_feedback(
-                    dimension, avg_score, responses
-                ),
-                "improvement_strategies": self._get_improvement_strategies(
-                    dimension, avg_score
-                ),
-                "resources": self._get_learning_resources(dimension),
-            }
+        return {
+            dimension: dimension_feedback
+            for dimension, dimension_feedback in zip(self.score_dimensions, results)
+            if dimension_feedback is not None
+        }
 
-        return feedback
+    def _build_dimension_feedback(
+        self,
+        dimension: str,
+        dimension_summary: Dict[str, float],
+        responses: List[ResponseRecord],
+    ) -> Optional[Dict[str, Any]]:
+        """Build the feedback entry for one dimension, or None if it was never scored"""
+        if not dimension_summary.get("count"):
+            return None
+
+        avg_score = dimension_summary["mean"]
+        return {
+            "current_level": self._get_skill_level(avg_score),
+            "specific_feedback": self._get_specific_feedback(
+                dimension, avg_score, responses
+            ),
+            "improvement_strategies": self._get_improvement_strategies(
+                dimension, avg_score
+            ),
+            "resources": self._get_learning_resources(dimension),
+        }
 
     def _get_skill_level(self, score: float) -> str:
         """Convert numeric score to skill level description"""
-        if score >= 4.5:
-            return "Expert"
-        elif score >= 4.0:
-            return "Advanced"
-        elif score >= 3.0:
-            return "Intermediate"
-        elif score >= 2.0:
-            return "Developing"
-        else:
-            return "Beginner"
+        return _SKILL_LEVELS[bisect_right(_SKILL_LEVEL_THRESHOLDS, score)]
 
     def _get_specific_feedback(
         self, dimension: str, avg_score: float, responses: List[ResponseRecord]
     ) -> str:
         """Generate specific feedback based on dimension and performance"""
-        feedback_templates = {
-            "correctness": {
-                "high": "Your technical solutions demonstrate strong accuracy and understanding of Excel fundamentals. You consistently provide correct formulas and approaches.",
-                "medium": "You show good grasp of Excel concepts but occasionally miss nuances in complex scenarios. Focus on edge cases and formula optimization.",
-                "low": "There are opportunities to strengthen your Excel technical foundation. Review basic functions, formula syntax, and common Excel operations.",
-            },
-            "design": {
-                "high": "Excellent approach to structuring Excel solutions. You think systematically about data organization and workflow efficiency.",
-                "medium": "Good design thinking with room for improvement in considering scalability and maintainability of Excel solutions.",
-                "low": "Focus on developing systematic approaches to Excel problem-solving. Consider data structure, user experience, and solution maintainability.",
-            },
-            "communication": {
-                "high": "You explain Excel concepts clearly and provide helpful context for your solutions. Your communication enhances understanding.",
-                "medium": "Generally clear communication with opportunities to be more specific about Excel terminology and step-by-step processes.",
-                "low": "Work on explaining Excel solutions more clearly. Use specific terminology and break down complex processes into steps.",
-            },
-            "production": {
-                "high": "Strong awareness of real-world Excel implementation challenges. You consider error handling, user experience, and maintainability.",
-                "medium": "Good understanding of practical Excel considerations with room to think more about scalability and robustness.",
-                "low": "Develop awareness of how Excel solutions work in practice. Consider error handling, data validation, and user-friendly design.",
-            },
-        }
-
         level = "high" if avg_score >= 4.0 else "medium" if avg_score >= 3.0 else "low"
-        return feedback_templates.get(dimension, {}).get(
+        return _SPECIFIC_FEEDBACK_TEMPLATES.get(dimension, {}).get(
             level, f"Continue developing your {dimension} skills."
         )
 
@@ -603,85 +1244,39 @@ class Reporter:
         self, dimension: str, avg_score: float
     ) -> List[str]:
         """Get specific improvement strategies for each dimension"""
-        strategies = {
-            "correctness": [
-                "Practice Excel functions daily with increasingly complex scenarios",
-                "Review Excel documentation for advanced function usage",
-                "Test formulas with edge cases and unusual data",
-                "Use Excel's formula auditing tools to understand formula logic",
-            ],
-            "design": [
-                "Study well-designed Excel templates and analyze their structure",
-                "Practice organizing data with proper headers, formatting, and layout",
-                "Learn about Excel table features and named ranges for better organization",
-                "Consider user workflow when designing Excel solutions",
-            ],
-            "communication": [
-                "Practice explaining Excel solutions to non-technical users",
-                "Use comments and documentation within Excel files",
-                "Create step-by-step guides for complex Excel processes",
-                "Learn Excel terminology to communicate more precisely",
-            ],
-            "production": [
-                "Learn about Excel security features and data protection",
-                "Practice error handling with IFERROR and data validation",
-                "Study Excel performance optimization techniques",
-                "Consider version control and collaboration features in Excel",
-            ],
-        }
-
-        all_strategies = strategies.get(dimension, [])
+        all_strategies = _IMPROVEMENT_STRATEGIES.get(dimension, [])
         if avg_score >= 4.0:
             return all_strategies[:2]
         elif avg_score >= 3.0:
             return all_strategies[:3]
         else:
-            return all_strategies
+            return list(all_strategies)
 
     def _get_learning_resources(self, dimension: str) -> List[str]:
         """Get learning resources for each dimension"""
-        resources = {
-            "correctness": [
-                "Microsoft Excel Help & Training (official documentation)",
-                "ExcelJet - Excel formulas and functions reference",
-                "Excel University courses for structured learning",
-            ],
-            "design": [
-                "Excel Dashboard School for design principles",
-                "Microsoft Excel templates gallery for inspiration",
-                "Excel Campus courses on professional Excel design",
-            ],
-            "communication": [
-                "Excel documentation best practices guides",
-                "Technical writing courses for clear explanations",
-                "Excel user community forums for communication practice",
-            ],
-            "production": [
-                "Microsoft Excel security and compliance documentation",
-                "Excel VBA resources for automation and robustness",
-                "Business analysis courses focusing on Excel implementations",
-            ],
-        }
-        return resources.get(dimension, [])
+        return list(_LEARNING_RESOURCES.get(dimension, []))
 
     def _generate_learning_path(
-        self, responses: List[ResponseRecord]
+        self, scores_summary: Dict[str, Dict[str, float]]
     ) -> Dict[str, Any]:
         """Generate a personalized learning path based on performance"""
-        if not responses:
+        if not scores_summary:
             return {}
 
-        dimension_scores = {}
-        for dimension in self.score_dimensions:
-            scores = [
-                r.scores.get(dimension, 0)
-                for r in responses
-                if r.scores and dimension in r.scores
-            ]
-            if scores:
-                dimension_scores[dimension] = statistics.mean(scores)
+        dimension_summaries = [scores_summary.get(d, {}) for d in self.score_dimensions]
+        means = np.fromiter(
+            (summary.get("mean", 0.0) for summary in dimension_summaries),
+            dtype=np.float64,
+            count=len(dimension_summaries),
+        )
+        counts = [summary.get("count", 0) for summary in dimension_summaries]
 
-        sorted_dimensions = sorted(dimension_scores.items(), key=lambda x: x[1])
+        # Stable sort keeps ties in score_dimensions order
+        sorted_dimensions = [
+            (self.score_dimensions[i], float(means[i]))
+            for i in np.argsort(means, kind="stable")
+            if counts[i]
+        ]
 
         learning_path = {
             "priority_focus": sorted_dimensions[0][0]
@@ -701,21 +1296,9 @@ class Reporter:
         if not sorted_dimensions:
             return []
 
-        primary_weakness = sorted_dimensions[0][0]
-        milestones = [
-            f"Month 1: Focus on {primary_weakness} fundamentals",
-            f"Month 2: Practice {primary_weakness} with real-world scenarios",
-            f"Month 3: Integrate {primary_weakness} improvements with other skills",
-        ]
-
+        milestones = list(_primary_milestones(sorted_dimensions[0][0]))
         if len(sorted_dimensions) > 1:
-            secondary_weakness = sorted_dimensions[1][0]
-            milestones.extend(
-                [
-                    f"Month 4-5: Address {secondary_weakness} development",
-                    "Month 6: Comprehensive practice integrating all skills",
-                ]
-            )
+            milestones.extend(_secondary_milestones(sorted_dimensions[1][0]))
 
         return milestones
 
@@ -726,15 +1309,19 @@ class Reporter:
         if len(responses) < 2:
             return {"trend": "insufficient_data"}
 
-        overall_scores = [r.scores.get("overall", 0) for r in responses if r.scores]
-        if len(overall_scores) < 2:
+        overall_scores = np.fromiter(
+            (r.scores.get("overall", 0) for r in responses if r.scores),
+            dtype=np.float64,
+        )
+        if overall_scores.size < 2:
             return {"trend": "insufficient_data"}
 
-        first_half = overall_scores[: len(overall_scores) // 2]
-        second_half = overall_scores[len(overall_scores) // 2 :]
+        half = overall_scores.size // 2
+        first_half = overall_scores[:half]
+        second_half = overall_scores[half:]
 
-        first_avg = statistics.mean(first_half)
-        second_avg = statistics.mean(second_half)
+        first_avg = first_half.mean()
+        second_avg = second_half.mean()
 
         if second_avg > first_avg + 0.3:
             trend = "improving"
@@ -751,8 +1338,8 @@ class Reporter:
         return {
             "trend": trend,
             "description": trend_description,
-            "first_half_avg": first_half,
-            "second_half_avg": second_half,
+            "first_half_avg": first_half.tolist(),
+            "second_half_avg": second_half.tolist(),
         }
 
     def _generate_next_steps(
@@ -783,263 +1370,78 @@ class Reporter:
 
     def format_constructive_text_report(self, report: Dict[str, Any]) -> str:
         """Generate an enhanced constructive feedback report"""
-        lines = [
-            "# 📊 Excel Skills Interview - Constructive Feedback Report",
-            "",
-            f"**Session ID:** {report.get('session_id', 'N/A')}",
-            f"**Date:** {str(report.get('timestamp', ''))[:19]}",
-            f"**Duration:** {report.get('duration_minutes', 0):.1f} minutes",
-            f"**Questions Answered:** {report.get('questions_answered', 0)}",
-        ]
-
-        # Add generation method indicator if available
-        if report.get("generation_method") == "fallback_rule_based":
-            lines.append(
-                "*Note: Generated using fallback method due to AI service unavailability*"
-            )
-
-        lines.extend(
-            [
-                "",
-                f"## 🎯 Overall Performance: {report.get('overall_score_normalized', 0):.0f}/100",
-                f"*Raw Score: {report.get('overall_score', 0):.2f}/5.0*",
-                "",
-            ]
-        )
-
-        enhanced_feedback = report.get("enhanced_feedback", {})
-        if enhanced_feedback:
-            lines.extend(["## 📈 Detailed Skill Analysis", ""])
-
-            for dimension, feedback in enhanced_feedback.items():
-                # Handle both agent-generated and rule-based feedback structures
-                current_level = feedback.get("current_level", "N/A")
-                specific_feedback = feedback.get(
-                    "specific_feedback", "No feedback available"
+        if self._is_empty_constructive_report(report):
+            return _EMPTY_CONSTRUCTIVE_REPORT_TEMPLATE.format_map(
+                ChainMap(
+                    {"date": str(report.get("timestamp", ""))[:19]},
+                    report,
+                    _REPORT_FIELD_DEFAULTS,
                 )
-
-                lines.extend(
-                    [
-                        f"### {dimension.title()}",
-                        f"**Current Level:** {current_level}",
-                        f"**Analysis:** {specific_feedback}",
-                        "",
-                    ]
-                )
-
-                # Handle improvement strategies
-                strategies = feedback.get("improvement_strategies", [])
-                if strategies:
-                    lines.append("**Improvement Strategies:**")
-                    for strategy in strategies:
-                        lines.append(f"• {strategy}")
-                    lines.append("")
-
-                # Handle learning resources
-                resources = feedback.get("resources", [])
-                if resources:
-                    lines.extend(["**Learning Resources:**"])
-                    for resource in resources:
-                        lines.append(f"• {resource}")
-                    lines.append("")
-
-        learning_path = report.get("learning_path", {})
-        if learning_path:
-            lines.extend(
-                [
-                    "## 🛤️ Personalized Learning Path",
-                    "",
-                    f"**Priority Focus:** {learning_path.get('priority_focus', 'N/A').title()}",
-                ]
-            )
-
-            secondary_focus = learning_path.get("secondary_focus")
-            if secondary_focus:
-                lines.append(f"**Secondary Focus:** {secondary_focus.title()}")
-
-            timeline = learning_path.get("timeline", "N/A")
-            lines.extend(
-                [
-                    f"**Recommended Timeline:** {timeline}",
-                    "",
-                ]
-            )
-
-            milestones = learning_path.get("milestones", [])
-            if milestones:
-                lines.append("**Learning Milestones:**")
-                for milestone in milestones:
-                    lines.append(f"• {milestone}")
-                lines.append("")
-
-        next_steps = report.get("next_steps", [])
-        if next_steps:
-            lines.extend(["## 🚀 Immediate Next Steps", ""])
-
-            for i, step in enumerate(next_steps, 1):
-                lines.append(f"{i}. {step}")
-
-            lines.append("")
-
-        performance_trends = report.get("performance_trends", {})
-        if (
-            performance_trends
-            and performance_trends.get("trend") != "insufficient_data"
-        ):
-            lines.extend(
-                [
-                    "## 📊 Performance Trends",
-                    "",
-                    f"**Trend:** {performance_trends.get('description', 'No trend analysis available')}",
-                    "",
-                ]
             )
 
-        # Add question-by-question feedback if available
-        detailed_responses = report.get("detailed_responses", [])
-        if detailed_responses:
-            lines.extend(["## 📝 Question-by-Question Feedback", ""])
-
-            for response in detailed_responses:
-                q_num = response.get("question_number", "?")
-                overall_score = response.get("scores", {}).get("overall", 0)
-                lines.extend(
-                    [
-                        f"### Question {q_num} (Score: {overall_score:.1f}/5.0)",
-                        f"**Question:** {response.get('question', 'N/A')[:150]}{'...' if len(response.get('question', '')) > 150 else ''}",
-                        f"**Your Response:** {response.get('answer_preview', 'No answer')}",
-                        "",
-                    ]
-                )
+        cache_key = _rendered_report_key("text", report)
+        with _RENDERED_REPORT_CACHE_LOCK:
+            cached = _RENDERED_REPORT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
-                rationale = response.get("rationale", "")
-                if rationale and rationale != "No evaluation rationale provided":
-                    lines.extend([f"**Detailed Feedback:** {rationale}", ""])
-
-        # Add raw statistics section
-        lines.extend(
-            [
-                "---",
-                "",
-                "## 📊 Raw Statistics",
-                "",
-                "### Session Details",
-                f"• **Session ID:** {report.get('session_id', 'N/A')}",
-                f"• **Timestamp:** {report.get('timestamp', 'N/A')}",
-                f"• **Duration:** {report.get('duration_minutes', 0):.1f} minutes",
-                f"• **Questions Answered:** {report.get('questions_answered', 0)}",
-                f"• **Overall Score (Raw):** {report.get('overall_score', 0):.3f}/5.0",
-                f"• **Overall Score (Normalized):** {report.get('overall_score_normalized', 0):.1f}/100",
-                "",
-            ]
+        text = _CONSTRUCTIVE_REPORT_TEMPLATE.render(
+            report=report, score_breakdown_template=_MD_SCORE_BREAKDOWN_TEMPLATE
         )
+        with _RENDERED_REPORT_CACHE_LOCK:
+            _RENDERED_REPORT_CACHE[cache_key] = text
+        return text
 
-        scores = report.get("scores", {})
-        if scores:
-            lines.extend(["### Score Breakdown by Dimension", ""])
-            for dimension in [
-                "correctness",
-                "design",
-                "communication",
-                "production",
-                "overall",
-            ]:
-                if dimension in scores:
-                    score_data = scores[dimension]
-                    lines.extend(
-                        [
-                            f"**{dimension.title()}:**",
-                            f"  • Mean: {score_data.get('mean', 0):.3f}",
-                            f"  • Median: {score_data.get('median', 0):.3f}",
-                            f"  • Min: {score_data.get('min', 0):.3f}",
-                            f"  • Max: {score_data.get('max', 0):.3f}",
-                            f"  • Count: {score_data.get('count', 0)}",
-                            "",
-                        ]
-                    )
-
-        # Add strengths and weaknesses from base report
-        strengths = report.get("strengths", [])
-        if strengths:
-            lines.extend(["### Identified Strengths", ""])
-            for strength in strengths:
-                lines.append(f"• {strength}")
-            lines.append("")
-
-        areas_for_improvement = report.get("areas_for_improvement", [])
-        if areas_for_improvement:
-            lines.extend(["### Areas for Improvement", ""])
-            for area in areas_for_improvement:
-                lines.append(f"• {area}")
-            lines.append("")
-
-        # Add metadata if available
-        meta = report.get("meta", {})
-        if meta:
-            lines.extend(["### Technical Metadata", ""])
-            for key, value in meta.items():
-                lines.append(f"• **{key}:** {value}")
-            lines.append("")
-
-        lines.extend(
-            [
-                "---",
-                "",
-                "## 💡 Remember",
-                "• Excel mastery comes with consistent practice",
-                "• Focus on real-world applications to reinforce learning",
-                "• Don't hesitate to explore Excel's extensive help documentation",
-                "• Consider joining Excel communities for ongoing support",
-                "",
-                "*This report is designed to help you grow. Focus on progress, not perfection!*",
-            ]
+    def _is_empty_constructive_report(self, report: Dict[str, Any]) -> bool:
+        if report.get("generation_method") == "fallback_rule_based":
+            return False
+        if any(report.get(key) for key in _CONSTRUCTIVE_REPORT_SECTIONS):
+            return False
+
+        performance_trends = report.get("performance_trends")
+        return (
+            not performance_trends
+            or performance_trends.get("trend") == "insufficient_data"
         )
 
-        return "\n".join(lines)
-
     def generate_pdf_report(self, report: Dict[str, Any]) -> str:
         """Generate a PDF report and return the file path"""
+        cache_key = _rendered_report_key("pdf", report)
+        with _RENDERED_REPORT_CACHE_LOCK:
+            cached_path = _RENDERED_REPORT_CACHE.get(cache_key)
+        if cached_path is not None and os.path.exists(cached_path):
+            return cached_path
+
         temp_dir = tempfile.gettempdir()
         session_id = report.get("session_id", "unknown")
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"excel_interview_report_{session_id}_{timestamp}.pdf"
+        filename = (
+            f"excel_interview_report_{session_id}_{os.getpid()}_{next(_PDF_COUNTER)}.pdf"
+        )
         filepath = os.path.join(temp_dir, filename)
 
-        doc = SimpleDocTemplate(filepath, pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-
-        title_style = ParagraphStyle(
-            "CustomTitle",
-            parent=styles["Heading1"],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=HexColor("#2E86AB"),
-            alignment=1,
-        )
+        # Gradio's file download needs a path, so the rendered bytes are
+        # written out in a single call rather than streamed by ReportLab.
+        pdf_bytes = self.generate_pdf_bytes(report)
+        with open(filepath, "wb") as f:
+            f.write(pdf_bytes)
 
-        heading_style = ParagraphStyle(
-            "CustomHeading",
-            parent=styles["Heading2"],
-            fontSize=16,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=HexColor("#A23B72"),
-        )
+        with _RENDERED_REPORT_CACHE_LOCK:
+            _RENDERED_REPORT_CACHE[cache_key] = filepath
+        return filepath
 
-        subheading_style = ParagraphStyle(
-            "CustomSubHeading",
-            parent=styles["Heading3"],
-            fontSize=14,
-            spaceAfter=8,
-            spaceBefore=12,
-            textColor=HexColor("#F18F01"),
-        )
+    def generate_pdf_bytes(self, report: Dict[str, Any]) -> bytes:
+        """Render the PDF report in memory and return its bytes"""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(buffer, pagesize=A4)
+        doc.build(list(self._iter_pdf_flowables(report)))
+        return buffer.getvalue()
 
-        story.append(Paragraph("Excel Skills Interview Report", title_style))
-        story.append(Spacer(1, 20))
+    def _iter_pdf_flowables(self, report: Dict[str, Any]) -> Iterator[Flowable]:
+        """Yield the PDF report flowables section by section"""
+        yield Paragraph("Excel Skills Interview Report", _TITLE_STYLE)
+        yield Spacer(1, 20)
 
-        story.append(Paragraph("Session Information", heading_style))
+        yield Paragraph("Session Information", _HEADING_STYLE)
         session_data = [
             ["Session ID:", report.get("session_id", "N/A")],
             ["Date:", str(report.get("timestamp", ""))[:19]],
@@ -1061,216 +1463,159 @@ class Reporter:
             )
         )
 
-        story.append(session_table)
-        story.append(Spacer(1, 20))
+        yield session_table
+        yield Spacer(1, 20)
 
         overall_score = report.get("overall_score_normalized", 0)
-        story.append(
-            Paragraph(f"Overall Score: {overall_score:.0f}/100", heading_style)
-        )
-        story.append(
-            Paragraph(
-                f"Raw Score: {report.get('overall_score', 0):.2f}/5.0", styles["Normal"]
-            )
+        yield Paragraph(f"Overall Score: {overall_score:.0f}/100", _HEADING_STYLE)
+        yield Paragraph(
+            f"Raw Score: {report.get('overall_score', 0):.2f}/5.0", _NORMAL_STYLE
         )
-        story.append(Spacer(1, 15))
+        yield Spacer(1, 15)
 
         enhanced_feedback = report.get("enhanced_feedback", {})
         if enhanced_feedback:
-            story.append(Paragraph("Detailed Skill Analysis", heading_style))
+            yield Paragraph("Detailed Skill Analysis", _HEADING_STYLE)
 
             for dimension, feedback in enhanced_feedback.items():
-                story.append(Paragraph(dimension.title(), subheading_style))
-                story.append(
-                    Paragraph(
-                        f"<b>Current Level:</b> {feedback.get('current_level', 'N/A')}",
-                        styles["Normal"],
-                    )
+                yield Paragraph(_title(dimension), _SUBHEADING_STYLE)
+                yield Paragraph(
+                    f"<b>Current Level:</b> {feedback.get('current_level', 'N/A')}",
+                    _NORMAL_STYLE,
                 )
-                story.append(
-                    Paragraph(
-                        f"<b>Analysis:</b> {feedback.get('specific_feedback', 'No feedback available')}",
-                        styles["Normal"],
-                    )
+                yield Paragraph(
+                    f"<b>Analysis:</b> {feedback.get('specific_feedback', 'No feedback available')}",
+                    _NORMAL_STYLE,
                 )
 
                 strategies = feedback.get("improvement_strategies", [])
                 if strategies:
-                    story.append(
-                        Paragraph("<b>Improvement Strategies:</b>", styles["Normal"])
+                    yield Paragraph("<b>Improvement Strategies:</b>", _NORMAL_STYLE)
+                    yield Paragraph(
+                        "<br/>".join(
+                            f"• {strategy}" for strategy in islice(strategies, 3)
+                        ),
+                        _NORMAL_STYLE,
                     )
-                    for strategy in strategies[:3]:
-                        story.append(Paragraph(f"• {strategy}", styles["Normal"]))
 
-                story.append(Spacer(1, 10))
+                yield Spacer(1, 10)
 
         learning_path = report.get("learning_path", {})
         if learning_path:
-            story.append(Paragraph("Personalized Learning Path", heading_style))
-            story.append(
-                Paragraph(
-                    f"<b>Priority Focus:</b> {learning_path.get('priority_focus', 'N/A').title()}",
-                    styles["Normal"],
-                )
+            yield Paragraph("Personalized Learning Path", _HEADING_STYLE)
+            yield Paragraph(
+                f"<b>Priority Focus:</b> {_title(learning_path.get('priority_focus', 'N/A'))}",
+                _NORMAL_STYLE,
             )
-            story.append(
-                Paragraph(
-                    f"<b>Timeline:</b> {learning_path.get('timeline', 'N/A')}",
-                    styles["Normal"],
-                )
+            yield Paragraph(
+                f"<b>Timeline:</b> {learning_path.get('timeline', 'N/A')}",
+                _NORMAL_STYLE,
             )
 
             milestones = learning_path.get("milestones", [])
             if milestones:
-                story.append(Paragraph("<b>Learning Milestones:</b>", styles["Normal"]))
-                for milestone in milestones[:3]:
-                    story.append(Paragraph(f"• {milestone}", styles["Normal"]))
+                yield Paragraph("<b>Learning Milestones:</b>", _NORMAL_STYLE)
+                yield Paragraph(
+                    "<br/>".join(
+                        f"• {milestone}" for milestone in islice(milestones, 3)
+                    ),
+                    _NORMAL_STYLE,
+                )
 
-            story.append(Spacer(1, 15))
+            yield Spacer(1, 15)
 
         next_steps = report.get("next_steps", [])
         if next_steps:
-            story.append(Paragraph("Immediate Next Steps", heading_style))
-            for i, step in enumerate(next_steps[:4], 1):
-                story.append(Paragraph(f"{i}. {step}", styles["Normal"]))
-            story.append(Spacer(1, 15))
+            yield Paragraph("Immediate Next Steps", _HEADING_STYLE)
+            yield Paragraph(
+                "<br/>".join(
+                    f"{i}. {step}" for i, step in enumerate(islice(next_steps, 4), 1)
+                ),
+                _NORMAL_STYLE,
+            )
+            yield Spacer(1, 15)
 
         detailed_responses = report.get("detailed_responses", [])
         if detailed_responses:
-            story.append(Paragraph("Question Summary", heading_style))
+            yield Paragraph("Question Summary", _HEADING_STYLE)
 
-            for response in detailed_responses[:3]:
+            for response in islice(detailed_responses, 3):
                 q_num = response.get("question_number", "?")
                 overall_score = response.get("scores", {}).get("overall", 0)
-                story.append(
-                    Paragraph(
-                        f"Question {q_num} (Score: {overall_score:.1f}/5.0)",
-                        subheading_style,
-                    )
+                yield Paragraph(
+                    f"Question {q_num} (Score: {overall_score:.1f}/5.0)",
+                    _SUBHEADING_STYLE,
                 )
 
-                question_text = response.get("question", "N/A")
-                if len(question_text) > 200:
-                    question_text = question_text[:200] + "..."
-                story.append(
-                    Paragraph(f"<b>Question:</b> {question_text}", styles["Normal"])
-                )
+                question_text = _truncate_text(response.get("question", "N/A"), 200)
+                yield Paragraph(f"<b>Question:</b> {question_text}", _NORMAL_STYLE)
 
                 answer_preview = response.get("answer_preview", "No answer")
-                story.append(
-                    Paragraph(
-                        f"<b>Your Response:</b> {answer_preview}", styles["Normal"]
-                    )
+                yield Paragraph(
+                    f"<b>Your Response:</b> {answer_preview}", _NORMAL_STYLE
                 )
 
                 rationale = response.get("rationale", "")
                 if rationale and rationale != "No evaluation rationale provided":
-                    if len(rationale) > 300:
-                        rationale = rationale[:300] + "..."
-                    story.append(
-                        Paragraph(f"<b>Feedback:</b> {rationale}", styles["Normal"])
+                    yield Paragraph(
+                        f"<b>Feedback:</b> {_truncate_text(rationale, 300)}",
+                        _NORMAL_STYLE,
                     )
 
-                story.append(Spacer(1, 10))
+                yield Spacer(1, 10)
 
-        story.append(Spacer(1, 20))
-        story.append(Paragraph("Raw Statistics", heading_style))
+        yield Spacer(1, 20)
+        yield Paragraph("Raw Statistics", _HEADING_STYLE)
 
-        story.append(Paragraph("<b>Session Details:</b>", styles["Normal"]))
-        story.append(
-            Paragraph(
-                f"• Session ID: {report.get('session_id', 'N/A')}", styles["Normal"]
-            )
-        )
-        story.append(
-            Paragraph(
-                f"• Timestamp: {report.get('timestamp', 'N/A')}", styles["Normal"]
-            )
-        )
-        story.append(
-            Paragraph(
-                f"• Duration: {report.get('duration_minutes', 0):.1f} minutes",
-                styles["Normal"],
-            )
-        )
-        story.append(
-            Paragraph(
-                f"• Questions Answered: {report.get('questions_answered', 0)}",
-                styles["Normal"],
-            )
-        )
-        story.append(
-            Paragraph(
-                f"• Overall Score (Raw): {report.get('overall_score', 0):.3f}/5.0",
-                styles["Normal"],
-            )
-        )
-        story.append(
-            Paragraph(
-                f"• Overall Score (Normalized): {report.get('overall_score_normalized', 0):.1f}/100",
-                styles["Normal"],
-            )
+        yield Paragraph("<b>Session Details:</b>", _NORMAL_STYLE)
+        yield Preformatted(
+            _PDF_SESSION_DETAILS_TEMPLATE.format_map(
+                ChainMap(report, _REPORT_FIELD_DEFAULTS)
+            ),
+            _CODE_STYLE,
         )
-        story.append(Spacer(1, 10))
+        yield Spacer(1, 10)
 
         scores = report.get("scores", {})
         if scores:
-            story.append(
-                Paragraph("<b>Score Breakdown by Dimension:</b>", styles["Normal"])
+            yield Paragraph("<b>Score Breakdown by Dimension:</b>", _NORMAL_STYLE)
+            yield Preformatted(
+                "\n".join(
+                    _PDF_SCORE_BREAKDOWN_TEMPLATE.format_map(score_fields)
+                    for score_fields in _iter_score_fields(scores)
+                ),
+                _CODE_STYLE,
             )
-            for dimension in [
-                "correctness",
-                "design",
-                "communication",
-                "production",
-                "overall",
-            ]:
-                if dimension in scores:
-                    score_data = scores[dimension]
-                    story.append(
-                        Paragraph(f"<b>{dimension.title()}:</b>", styles["Normal"])
-                    )
-                    story.append(
-                        Paragraph(
-                            f"  Mean: {score_data.get('mean', 0):.3f}, Median: {score_data.get('median', 0):.3f}",
-                            styles["Normal"],
-                        )
-                    )
-                    story.append(
-                        Paragraph(
-                            f"  Min: {score_data.get('min', 0):.3f}, Max: {score_data.get('max', 0):.3f}, Count: {score_data.get('count', 0)}",
-                            styles["Normal"],
-                        )
-                    )
-            story.append(Spacer(1, 10))
+            yield Spacer(1, 10)
 
         strengths = report.get("strengths", [])
         if strengths:
-            story.append(Paragraph("<b>Identified Strengths:</b>", styles["Normal"]))
-            for strength in strengths:
-                story.append(Paragraph(f"• {strength}", styles["Normal"]))
-            story.append(Spacer(1, 5))
+            yield Paragraph("<b>Identified Strengths:</b>", _NORMAL_STYLE)
+            yield Paragraph(
+                "<br/>".join(f"• {strength}" for strength in strengths),
+                _NORMAL_STYLE,
+            )
+            yield Spacer(1, 5)
 
         areas_for_improvement = report.get("areas_for_improvement", [])
         if areas_for_improvement:
-            story.append(Paragraph("<b>Areas for Improvement:</b>", styles["Normal"]))
-            for area in areas_for_improvement:
-                story.append(Paragraph(f"• {area}", styles["Normal"]))
-            story.append(Spacer(1, 5))
+            yield Paragraph("<b>Areas for Improvement:</b>", _NORMAL_STYLE)
+            yield Paragraph(
+                "<br/>".join(f"• {area}" for area in areas_for_improvement),
+                _NORMAL_STYLE,
+            )
+            yield Spacer(1, 5)
 
         meta = report.get("meta", {})
         if meta:
-            story.append(Paragraph("<b>Technical Metadata:</b>", styles["Normal"]))
-            for key, value in meta.items():
-                story.append(Paragraph(f"• {key}: {value}", styles["Normal"]))
-
-        story.append(Spacer(1, 20))
-        story.append(
-            Paragraph(
-                "Remember: Excel mastery comes with consistent practice. Focus on progress, not perfection!",
-                styles["Italic"],
+            yield Paragraph("<b>Technical Metadata:</b>", _NORMAL_STYLE)
+            yield Paragraph(
+                "<br/>".join(f"• {key}: {value}" for key, value in meta.items()),
+                _NORMAL_STYLE,
             )
-        )
 
-        doc.build(story)
-        return filepath
+        yield Spacer(1, 20)
+        yield Paragraph(
+            "Remember: Excel mastery comes with consistent practice. Focus on progress, not perfection!",
+            _ITALIC_STYLE,
+        )
@@ -0,0 +1,121 @@
+import copy
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional
+
+import numpy as np
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+from src.interview_engine.llm import get_embeddings_model
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Cosine-similarity cache over embedded text for reusing LLM outputs"""
+
+    def __init__(
+        self,
+        embedding_model: str = "models/gemini-embedding-001",
+        similarity_threshold: float = 0.92,
+        context_threshold: float = 0.9,
+        ttl_seconds: float = 24 * 60 * 60,
+        max_entries: int = 1024,
+    ):
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.context_threshold = context_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0}
+
+        self._embeddings: Optional[GoogleGenerativeAIEmbeddings] = None
+        self._vectors: List[np.ndarray] = []
+        self._values: List[Any] = []
+        self._buckets: List[Hashable] = []
+        self._contexts: List[Optional[np.ndarray]] = []
+        self._expires_at: List[float] = []
+        self._lock = threading.Lock()
+
+        # A lookup miss is normally followed by a store of the same text.
+        self._embed = lru_cache(maxsize=256)(self._embed_text)
+
+    def lookup(
+        self, text: str, bucket: Hashable = None, context: Optional[str] = None
+    ) -> Optional[Any]:
+        """Return the closest cached value whose preceding context also matches"""
+        vector = self._embed(text)
+        context_vector = self._embed(context) if context is not None else None
+
+        with self._lock:
+            self._evict_expired()
+            if not self._vectors:
+                self.stats["misses"] += 1
+                return None
+
+            similarities = np.stack(self._vectors) @ vector
+            for i, entry_bucket in enumerate(self._buckets):
+                if entry_bucket != bucket:
+                    similarities[i] = -1.0
+
+            # Best match first, skipping near-duplicates asked in another context
+            for best in np.argsort(similarities)[::-1]:
+                if similarities[best] < self.similarity_threshold:
+                    break
+                if self._context_matches(self._contexts[best], context_vector):
+                    self.stats["hits"] += 1
+                    return copy.deepcopy(self._values[best])
+
+            self.stats["misses"] += 1
+            return None
+
+    def store(
+        self,
+        text: str,
+        value: Any,
+        bucket: Hashable = None,
+        context: Optional[str] = None,
+    ):
+        vector = self._embed(text)
+        context_vector = self._embed(context) if context is not None else None
+
+        with self._lock:
+            self._evict_expired()
+            if len(self._vectors) >= self.max_entries:
+                self._remove(0)
+
+            self._vectors.append(vector)
+            self._values.append(copy.deepcopy(value))
+            self._buckets.append(bucket)
+            self._contexts.append(context_vector)
+            self._expires_at.append(time.monotonic() + self.ttl_seconds)
+
+    def _context_matches(
+        self, cached: Optional[np.ndarray], current: Optional[np.ndarray]
+    ) -> bool:
+        if cached is None or current is None:
+            return cached is None and current is None
+        return float(cached @ current) >= self.context_threshold
+
+    def _embed_text(self, text: str) -> np.ndarray:
+        if self._embeddings is None:
+            # Shared with every other cache on the same model, and its channel
+            self._embeddings = get_embeddings_model(self.embedding_model)
+
+        vector = np.asarray(self._embeddings.embed_query(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        while self._expires_at and self._expires_at[0] <= now:
+            self._remove(0)
+
+    def _remove(self, index: int):
+        del self._vectors[index]
+        del self._values[index]
+        del self._buckets[index]
+        del self._contexts[index]
+        del self._expires_at[index]
@@ -1,185 +1,277 @@
-import gradio as gr
-from typing import List, Tuple, Optional
-
-from src.interview_engine import (
-    InterviewEngine,
-    LLMEvaluator,
-    Reporter,
-    Persistence,
-    QuestionGenerator,
-)
+import asyncio
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Tuple, Optional
+
+if TYPE_CHECKING:
+    import gradio as gr
+
+    from src.interview_engine import InterviewEngine
+
+_STREAM_UPDATE_INTERVAL = 0.05
+
+# Sessions no longer share an engine, so their events can run side by side
+_SESSION_CONCURRENCY = 16
+
+# Renders PDF reports in the background for every session
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pdf-report")
+
+# Static page assets, built once per process rather than per interface
+_CSS = """
+.gradio-container {
+    max-width: 1200px;
+    margin: auto;
+}
+.chat-container {
+    height: 500px;
+}
+.report-container {
+    max-height: 600px;
+    overflow-y: auto;
+    padding: 15px;
+    border: 1px solid #444;
+    border-radius: 8px;
+    background-color: #2c3e50 !important;
+    color: #ecf0f1 !important;
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+}
+.report-container * {
+    color: #ecf0f1 !important;
+}
+.report-container h1 {
+    color: #ecf0f1 !important;
+    border-bottom: 2px solid #f39c12;
+    padding-bottom: 10px;
+}
+.report-container h2 {
+    color: #bdc3c7 !important;
+    margin-top: 25px;
+    margin-bottom: 15px;
+}
+.report-container h3 {
+    color: #95a5a6 !important;
+    margin-top: 20px;
+    margin-bottom: 10px;
+}
+.report-container ul {
+    margin-left: 20px;
+}
+.report-container li {
+    margin-bottom: 5px;
+}
+.report-container strong {
+    color: #ecf0f1 !important;
+}
+.report-container em {
+    color: #95a5a6 !important;
+    font-style: italic;
+}
+.report-container a {
+    color: #f39c12 !important;
+}
+"""
+
+_INTRO_MARKDOWN = """
+# 🎯 Technical Interview System
+
+This system will conduct a structured technical interview with automated evaluation.
+Your responses will be evaluated on correctness, design thinking, communication, and production readiness.
+"""
+
+# OpenAI-style chat messages, as used by gr.Chatbot(type="messages")
+ChatHistory = List[Dict[str, str]]
 
 
 class InterviewApp:
     def __init__(self):
-        self.engine: Optional[InterviewEngine] = None
+        # Each browser session keeps its own engine in a gr.State; only the
+        # stateless collaborators below are shared, built on the first interview
+        self._components: Optional[Dict[str, Any]] = None
+        # Dropped along with the engine when its session goes away
+        self._pdf_futures: "weakref.WeakKeyDictionary[InterviewEngine, Future]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _get_components(self) -> Dict[str, Any]:
+        """Build the session-independent engine collaborators once and reuse them"""
+        if self._components is None:
+            # Deferred so the UI can be built and served before LangChain loads
+            from src.interview_engine import (
+                LLMEvaluator,
+                Reporter,
+                Persistence,
+                QuestionGenerator,
+                SemanticCache,
+            )
+
+            # Answers are only reused for the same question text, and need to
+            # be closer than reports before their scores are shared
+            evaluation_cache = SemanticCache(similarity_threshold=0.95)
+
+            self._components = {
+                "evaluator": LLMEvaluator(semantic_cache=evaluation_cache),
+                "question_generator": QuestionGenerator(),
+                "reporter": Reporter(semantic_cache=SemanticCache()),
+                "persistence": Persistence(),
+            }
 
-    def start_interview(self) -> Tuple[List[List[str]], str, bool, bool]:
+        return self._components
+
+    async def start_interview(
+        self,
+    ) -> AsyncIterator[
+        Tuple[ChatHistory, str, bool, bool, Optional["InterviewEngine"]]
+    ]:
         try:
-            evaluator = LLMEvaluator()
-            question_generator = QuestionGenerator()
-            reporter = Reporter()
-            persistence = Persistence()
-
-            self.engine = InterviewEngine(
-                evaluator=evaluator,
-                question_generator=question_generator,
-                reporter=reporter,
-                persistence=persistence,
-            )
+            from src.interview_engine import InterviewEngine
 
-            welcome_message = self.engine.ask_next()
+            engine = InterviewEngine(**self._get_components())
 
-            chat_history = [["Interviewer", welcome_message]]
+            # The intro step saves the new session's state to disk
+            welcome_message = await asyncio.to_thread(engine.ask_next)
 
-            chat_history.append(["You", "I understand"])
+            chat_history = [
+                {"role": "assistant", "content": welcome_message},
+                {"role": "assistant", "content": ""},
+            ]
+            yield chat_history, "", False, False, engine
 
-            next_response = self.engine.process_response("I understand")
-            chat_history.append(["Interviewer", next_response])
+            # The intro needs no reply, so go straight on to the first question
+            async for chat_history in self._stream_reply(
+                chat_history, engine.aask_next_stream()
+            ):
+                yield chat_history, "", False, False, engine
 
-            return (chat_history, "", True, False)
+            yield chat_history, "", True, False, engine
 
         except Exception as e:
             error_msg = f"Failed to start interview: {str(e)}"
-            error_chat = [["System", error_msg]]
-            return (error_chat, "", False, False)
-
-    def submit_response(
-        self, user_message: str, chat_history: List[List[str]]
-    ) -> Tuple[List[List[str]], str, bool]:
-        if not self.engine:
-            return chat_history or [], "", False
+            error_chat = [{"role": "assistant", "content": error_msg}]
+            yield error_chat, "", False, False, None
+
+    async def _stream_reply(
+        self, chat_history: ChatHistory, stream: AsyncIterator[str]
+    ) -> AsyncIterator[ChatHistory]:
+        """Write streamed text into the last message, yielding it at a capped rate"""
+        last_yield = time.monotonic()
+        async for partial in stream:
+            chat_history[-1]["content"] = partial
+            # Coalesce token updates so the browser isn't sent one per token
+            now = time.monotonic()
+            if now - last_yield >= _STREAM_UPDATE_INTERVAL:
+                last_yield = now
+                yield chat_history
+
+    async def submit_response(
+        self,
+        user_message: str,
+        chat_history: ChatHistory,
+        engine: Optional["InterviewEngine"],
+    ) -> AsyncIterator[Tuple[ChatHistory, str, bool]]:
+        if not engine:
+            yield chat_history or [], "", False
+            return
 
         if not user_message.strip():
-            return chat_history or [], "", False
+            yield chat_history or [], "", False
+            return
 
-        try:
-            if chat_history is None:
-                chat_history = []
-
-            chat_history.append(["You", user_message])
-
-            response = self.engine.process_response(user_message)
+        if chat_history is None:
+            chat_history = []
 
-            chat_history.append(["Interviewer", response])
+        chat_history.append({"role": "user", "content": user_message})
+        chat_history.append({"role": "assistant", "content": ""})
+        yield chat_history, "", False
 
-            is_complete = self.engine.is_complete()
+        try:
+            async for chat_history in self._stream_reply(
+                chat_history, engine.aprocess_response_stream(user_message)
+            ):
+                yield chat_history, "", False
 
-            return chat_history, "", is_complete
+            is_complete = engine.is_complete()
+            if is_complete:
+                self._prewarm_pdf_report(engine)
+            yield chat_history, "", is_complete
 
         except Exception as e:
-            error_response = f"Error processing response: {str(e)}"
-            chat_history.append(["Interviewer", error_response])
-            return chat_history, "", False
-
-    def end_interview_early(
-        self, chat_history: List[List[str]]
-    ) -> Tuple[List[List[str]], bool]:
-        if not self.engine:
+            chat_history[-1]["content"] = f"Error processing response: {str(e)}"
+            yield chat_history, "", False
+
+    async def end_interview_early(
+        self, chat_history: ChatHistory, engine: Optional["InterviewEngine"]
+    ) -> Tuple[ChatHistory, bool]:
+        if not engine:
             return chat_history or [], False
 
         try:
             if chat_history is None:
                 chat_history = []
 
-            end_message = self.engine.end_early()
-            chat_history.append(["System", "[Interview ended early by user]"])
-            chat_history.append(["Interviewer", end_message])
+            end_message = await engine.aend_early()
+            chat_history.append(
+                {"role": "user", "content": "[Interview ended early by user]"}
+            )
+            chat_history.append({"role": "assistant", "content": end_message})
+            self._prewarm_pdf_report(engine)
 
             return chat_history, True
 
         except Exception as e:
             error_msg = f"Error ending interview: {str(e)}"
-            chat_history.append(["System", f"[Error ending interview: {error_msg}]"])
+            chat_history.append(
+                {
+                    "role": "assistant",
+                    "content": f"[Error ending interview: {error_msg}]",
+                }
+            )
             return chat_history, False
 
-    def get_report(self) -> str:
-        if not self.engine or not self.engine.is_complete():
+    def get_report(self, engine: Optional["InterviewEngine"]) -> str:
+        if not engine or not engine.is_complete():
             return "Interview not complete"
 
         try:
-            text_report = self.engine.get_text_report()
+            text_report = engine.get_text_report()
             return text_report if text_report else "No text report available"
 
         except Exception as e:
             return f"Error retrieving report: {str(e)}"
 
-    def download_pdf_report(self) -> Optional[str]:
-        if not self.engine or not self.engine.is_complete():
+    async def download_pdf_report(
+        self, engine: Optional["InterviewEngine"]
+    ) -> Optional[str]:
+        if not engine or not engine.is_complete():
             return None
 
         try:
-            pdf_path = self.engine.get_pdf_report_path()
-            return pdf_path
+            return await asyncio.wrap_future(self._prewarm_pdf_report(engine))
 
         except Exception as e:
+            # Let the next click try again instead of re-raising the same error
+            self._pdf_futures.pop(engine, None)
             print(f"Error generating PDF report: {str(e)}")
             return None
 
-    def create_interface(self) -> gr.Blocks:
+    def _prewarm_pdf_report(self, engine: "InterviewEngine") -> Future:
+        """Start rendering the PDF so the download button gets a finished file"""
+        future = self._pdf_futures.get(engine)
+        if future is None:
+            future = _PDF_EXECUTOR.submit(engine.get_pdf_report_path)
+            self._pdf_futures[engine] = future
+        return future
+
+    def create_interface(self) -> "gr.Blocks":
+        # Only building the UI needs Gradio; the handlers above do not
+        import gradio as gr
+
         with gr.Blocks(
             title="Technical Interview System",
             theme=gr.themes.Soft(),
-            css="""
-            .gradio-container {
-                max-width: 1200px;
-                margin: auto;
-            }
-            .chat-container {
-                height: 500px;
-            }
-            .report-container {
-                max-height: 600px;
-                overflow-y: auto;
-                padding: 15px;
-                border: 1px solid #444;
-                border-radius: 8px;
-                background-color: #2c3e50 !important;
-                color: #ecf0f1 !important;
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            }
-            .report-container * {
-                color: #ecf0f1 !important;
-            }
-            .report-container h1 {
-                color: #ecf0f1 !important;
-                border-bottom: 2px solid #f39c12;
-                padding-bottom: 10px;
-            }
-            .report-container h2 {
-                color: #bdc3c7 !important;
-                margin-top: 25px;
-                margin-bottom: 15px;
-            }
-            .report-container h3 {
-                color: #95a5a6 !important;
-                margin-top: 20px;
-                margin-bottom: 10px;
-            }
-            .report-container ul {
-                margin-left: 20px;
-            }
-            .report-container li {
-                margin-bottom: 5px;
-            }
-            .report-container strong {
-                color: #ecf0f1 !important;
-            }
-            .report-container em {
-                color: #95a5a6 !important;
-                font-style: italic;
-            }
-            .report-container a {
-                color: #f39c12 !important;
-            }
-            """,
+            css=_CSS,
         ) as interface:
-            gr.Markdown("""
-            # 🎯 Technical Interview System
-            
-            This system will conduct a structured technical interview with automated evaluation.
-            Your responses will be evaluated on correctness, design thinking, communication, and production readiness.
-            """)
+            gr.Markdown(_INTRO_MARKDOWN)
 
             with gr.Row():
                 with gr.Column():
@@ -189,7 +281,10 @@ class InterviewApp:
             with gr.Row():
                 with gr.Column(scale=3):
                     chatbot = gr.Chatbot(
-                        label="Interview Chat", height=500, show_label=True
+                        label="Interview Chat",
+                        height=500,
+                        show_label=True,
+                        type="messages",
                     )
 
                     with gr.Row():
@@ -211,6 +306,7 @@ class InterviewApp:
 
                     interview_active = gr.State(False)
                     interview_complete = gr.State(False)
+                    engine_state = gr.State(None)
 
                     report_btn = gr.Button(
                         "Get Report", variant="secondary", interactive=False
@@ -244,6 +340,7 @@ class InterviewApp:
                     user_input,
                     interview_active,
                     interview_complete,
+                    engine_state,
                 ],
             ).then(
                 fn=lambda active: gr.update(interactive=active),
@@ -257,7 +354,7 @@ class InterviewApp:
 
             submit_btn.click(
                 fn=self.submit_response,
-                inputs=[user_input, chatbot],
+                inputs=[user_input, chatbot, engine_state],
                 outputs=[chatbot, user_input, interview_complete],
             ).then(
                 fn=lambda complete: (
@@ -270,7 +367,7 @@ class InterviewApp:
 
             end_early_btn.click(
                 fn=self.end_interview_early,
-                inputs=[chatbot],
+                inputs=[chatbot, engine_state],
                 outputs=[chatbot, interview_complete],
             ).then(
                 fn=lambda complete: (
@@ -284,13 +381,16 @@ class InterviewApp:
                 outputs=[submit_btn, end_early_btn],
             )
 
-            report_btn.click(fn=self.get_report, outputs=[text_report]).then(
+            report_btn.click(
+                fn=self.get_report, inputs=[engine_state], outputs=[text_report]
+            ).then(
                 fn=lambda: (gr.update(visible=False), gr.update(visible=True)),
                 outputs=[report_btn, download_btn],
             )
 
             download_btn.click(
                 fn=self.download_pdf_report,
+                inputs=[engine_state],
                 outputs=[pdf_file_output],
             ).then(
                 fn=lambda: gr.update(visible=True),
@@ -299,7 +399,7 @@ class InterviewApp:
 
             user_input.submit(
                 fn=self.submit_response,
-                inputs=[user_input, chatbot],
+                inputs=[user_input, chatbot, engine_state],
                 outputs=[chatbot, user_input, interview_complete],
             ).then(
                 fn=lambda complete: (
@@ -310,9 +410,11 @@ class InterviewApp:
                 outputs=[report_btn, download_btn],
             )
 
+        interface.queue(default_concurrency_limit=_SESSION_CONCURRENCY)
+
         return interface
 
 
-def create_app() -> gr.Blocks:
+def create_app() -> "gr.Blocks":
     app = InterviewApp()
     return app.create_interface()